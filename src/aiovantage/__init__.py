@@ -1,14 +1,23 @@
 """Asynchronous Python library for controlling Vantage InFusion controllers."""
 
 import asyncio
+import warnings
 from collections.abc import Callable, Iterator
+from functools import cached_property, partial
+from inspect import iscoroutinefunction
 from ssl import SSLContext
 from types import TracebackType
-from typing import Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from typing_extensions import Self
 
-from ._controllers.events import EventCallback, VantageEvent
+from ._controllers.events import (
+    EventCallback,
+    EventHandler,
+    EventQueue,
+    OverflowPolicy,
+    VantageEvent,
+)
 from ._logger import logger
 from .command_client import CommandClient, EventStream
 from .config_client import ConfigClient
@@ -38,11 +47,30 @@ from .controllers import (
 )
 from .objects import SystemObject
 
-__all__ = ["Vantage", "VantageEvent", "logger"]
+__all__ = ["Vantage", "VantageEvent", "enable_uvloop", "logger"]
 
 ControllerT = TypeVar("ControllerT", bound=BaseController[Any])
 
 
+def enable_uvloop() -> bool:
+    """Use uvloop as the asyncio event loop implementation, if it is installed.
+
+    uvloop is an optional dependency, installed with `pip install aiovantage[fast]`,
+    which speeds up socket-heavy workloads. This must be called before the event
+    loop is created, eg. before calling `asyncio.run`.
+
+    Returns:
+        True if the uvloop event loop policy was set, False if uvloop is unavailable.
+    """
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())  # type: ignore
+    return True
+
+
 class Vantage:
     """Main client for interacting with Vantage systems.
 
@@ -50,6 +78,31 @@ class Vantage:
     exposing "controllers" for fetching and interacting with objects in the system.
     """
 
+    # Attribute names of the controllers, in the order they are initialized
+    _controller_names = (
+        "anemo_sensors",
+        "areas",
+        "back_boxes",
+        "blind_groups",
+        "blinds",
+        "buttons",
+        "dry_contacts",
+        "gmem",
+        "light_sensors",
+        "load_groups",
+        "loads",
+        "masters",
+        "modules",
+        "rgb_loads",
+        "omni_sensors",
+        "port_devices",
+        "power_profiles",
+        "stations",
+        "tasks",
+        "temperature_sensors",
+        "thermostats",
+    )
+
     def __init__(
         self,
         host: str,
@@ -60,6 +113,7 @@ class Vantage:
         ssl_context_factory: Callable[[], SSLContext] | None = None,
         config_port: int | None = None,
         command_port: int | None = None,
+        config_pool_size: int = 1,
     ) -> None:
         """Initialize the Vantage instance.
 
@@ -71,6 +125,7 @@ class Vantage:
             ssl_context_factory: A factory function to use when creating default SSL contexts.
             config_port: The port to use for the config client.
             command_port: The port to use for the command client.
+            config_pool_size: The maximum number of connections the config client opens.
         """
         # Set up clients
         self._host = host
@@ -81,6 +136,7 @@ class Vantage:
             ssl=ssl,
             ssl_context_factory=ssl_context_factory,
             port=config_port,
+            pool_size=config_pool_size,
         )
 
         self._command_client = CommandClient(
@@ -101,50 +157,44 @@ class Vantage:
             port=command_port,
         )
 
-        # Set up controllers
-        def add_controller(controller_cls: type[ControllerT]) -> ControllerT:
-            controller = controller_cls(self)
-            self._controllers.add(controller)
-            return controller
-
-        self._controllers: set[BaseController[Any]] = set()
-        self._anemo_sensors = add_controller(AnemoSensorsController)
-        self._areas = add_controller(AreasController)
-        self._back_boxes = add_controller(BackBoxesController)
-        self._blind_groups = add_controller(BlindGroupsController)
-        self._blinds = add_controller(BlindsController)
-        self._buttons = add_controller(ButtonsController)
-        self._dry_contacts = add_controller(DryContactsController)
-        self._gmem = add_controller(GMemController)
-        self._light_sensors = add_controller(LightSensorsController)
-        self._load_groups = add_controller(LoadGroupsController)
-        self._loads = add_controller(LoadsController)
-        self._masters = add_controller(MastersController)
-        self._modules = add_controller(ModulesController)
-        self._rgb_loads = add_controller(RGBLoadsController)
-        self._omni_sensors = add_controller(OmniSensorsController)
-        self._port_devices = add_controller(PortDevicesController)
-        self._power_profiles = add_controller(PowerProfilesController)
-        self._stations = add_controller(StationsController)
-        self._tasks = add_controller(TasksController)
-        self._temperature_sensors = add_controller(TemperatureSensorsController)
-        self._thermostats = add_controller(ThermostatsController)
+        # Controllers are constructed on first access
+        self._vid_index: dict[int, BaseController[Any]] = {}
+        self._subscribers: list[EventHandler[SystemObject]] = []
 
     def __getitem__(self, vid: int) -> SystemObject:
         """Return the object with the given Vantage ID."""
-        for controller in self._controllers:
-            if vid in controller:
-                return cast(SystemObject, controller[vid])
-        raise KeyError(vid)
+        controller = self._vid_index.get(vid)
+        if controller is None:
+            raise KeyError(vid)
+
+        return cast(SystemObject, controller[vid])
 
     def __contains__(self, vid: int) -> bool:
         """Is the given Vantage ID known by any controller."""
-        return any(vid in controller for controller in self._controllers)
+        return vid in self._vid_index
 
     def __iter__(self) -> Iterator[SystemObject]:
         """Iterate over all objects known by the controllers."""
-        for controller in self._controllers:
-            yield from controller
+        return (controller[vid] for vid, controller in self._vid_index.items())
+
+    # Hidden from type checkers, so typos in attribute names are still reported
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> BaseController[Any]:
+            """Support the legacy private controller attribute names, eg. `_loads`."""
+            # Only called when normal attribute lookup fails
+            if not name.startswith("_") or name[1:] not in self._controller_names:
+                raise AttributeError(
+                    f"'{type(self).__name__}' object has no attribute '{name}'"
+                )
+
+            warnings.warn(
+                f"Vantage.{name} is deprecated, use Vantage.{name[1:]} instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
+            return cast(BaseController[Any], getattr(self, name[1:]))
 
     async def __aenter__(self) -> Self:
         """Return context manager."""
@@ -181,110 +231,110 @@ class Vantage:
         """The event stream instance."""
         return self._event_stream
 
-    @property
+    @cached_property
     def anemo_sensors(self) -> AnemoSensorsController:
         """Controller for interacting with wind speed sensors."""
-        return self._anemo_sensors
+        return self._add_controller(AnemoSensorsController)
 
-    @property
+    @cached_property
     def areas(self) -> AreasController:
         """Controller for interacting with areas."""
-        return self._areas
+        return self._add_controller(AreasController)
 
-    @property
+    @cached_property
     def back_boxes(self) -> BackBoxesController:
         """Controller for interacting with back boxes."""
-        return self._back_boxes
+        return self._add_controller(BackBoxesController)
 
-    @property
-    def blinds(self) -> BlindsController:
-        """Controller for interacting with blinds."""
-        return self._blinds
-
-    @property
+    @cached_property
     def blind_groups(self) -> BlindGroupsController:
         """Controller for interacting with groups of blinds."""
-        return self._blind_groups
+        return self._add_controller(BlindGroupsController)
 
-    @property
+    @cached_property
+    def blinds(self) -> BlindsController:
+        """Controller for interacting with blinds."""
+        return self._add_controller(BlindsController)
+
+    @cached_property
     def buttons(self) -> ButtonsController:
         """Controller for interacting with keypad buttons."""
-        return self._buttons
+        return self._add_controller(ButtonsController)
 
-    @property
+    @cached_property
     def dry_contacts(self) -> DryContactsController:
         """Controller for interacting with dry contacts."""
-        return self._dry_contacts
+        return self._add_controller(DryContactsController)
 
-    @property
+    @cached_property
     def gmem(self) -> GMemController:
         """Controller for interacting with variables."""
-        return self._gmem
+        return self._add_controller(GMemController)
 
-    @property
+    @cached_property
     def light_sensors(self) -> LightSensorsController:
         """Controller for interacting with light sensors."""
-        return self._light_sensors
-
-    @property
-    def loads(self) -> LoadsController:
-        """Controller for interacting with loads (lights, fans, etc)."""
-        return self._loads
+        return self._add_controller(LightSensorsController)
 
-    @property
+    @cached_property
     def load_groups(self) -> LoadGroupsController:
         """Controller for interacting with groups of loads."""
-        return self._load_groups
+        return self._add_controller(LoadGroupsController)
 
-    @property
+    @cached_property
+    def loads(self) -> LoadsController:
+        """Controller for interacting with loads (lights, fans, etc)."""
+        return self._add_controller(LoadsController)
+
+    @cached_property
     def masters(self) -> MastersController:
         """Controller for interacting with Vantage Controllers."""
-        return self._masters
+        return self._add_controller(MastersController)
 
-    @property
+    @cached_property
     def modules(self) -> ModulesController:
         """Controller for interacting with dimmer modules."""
-        return self._modules
+        return self._add_controller(ModulesController)
 
-    @property
+    @cached_property
+    def rgb_loads(self) -> RGBLoadsController:
+        """Controller for interacting with RGB loads."""
+        return self._add_controller(RGBLoadsController)
+
+    @cached_property
     def omni_sensors(self) -> OmniSensorsController:
         """Controller for interacting with "omni" sensors."""
-        return self._omni_sensors
+        return self._add_controller(OmniSensorsController)
 
-    @property
+    @cached_property
     def port_devices(self) -> PortDevicesController:
         """Controller for interacting with port devices."""
-        return self._port_devices
+        return self._add_controller(PortDevicesController)
 
-    @property
+    @cached_property
     def power_profiles(self) -> PowerProfilesController:
         """Controller for interacting with power profiles."""
-        return self._power_profiles
-
-    @property
-    def rgb_loads(self) -> RGBLoadsController:
-        """Controller for interacting with RGB loads."""
-        return self._rgb_loads
+        return self._add_controller(PowerProfilesController)
 
-    @property
+    @cached_property
     def stations(self) -> StationsController:
         """Controller for interacting with stations (keypads, etc)."""
-        return self._stations
+        return self._add_controller(StationsController)
 
-    @property
+    @cached_property
     def tasks(self) -> TasksController:
         """Controller for interacting with tasks."""
-        return self._tasks
+        return self._add_controller(TasksController)
 
-    @property
+    @cached_property
     def temperature_sensors(self) -> TemperatureSensorsController:
         """Controller for interacting with temperature sensors."""
-        return self._temperature_sensors
+        return self._add_controller(TemperatureSensorsController)
 
-    @property
+    @cached_property
     def thermostats(self) -> ThermostatsController:
         """Controller for interacting with thermostats."""
-        return self._thermostats
+        return self._add_controller(ThermostatsController)
 
     def get(self, vid: int) -> SystemObject | None:
         """Return the item with the given Vantage ID.
@@ -295,10 +345,8 @@ class Vantage:
         Returns:
             The object if it exists and has been fetched by a controller, or None.
         """
-        try:
-            return self[vid]
-        except KeyError:
-            return None
+        controller = self._vid_index.get(vid)
+        return None if controller is None else cast(SystemObject, controller[vid])
 
     def close(self) -> None:
         """Close all client connections."""
@@ -307,40 +355,108 @@ class Vantage:
         self.event_stream.stop()
 
     async def initialize(
-        self, *, fetch_state: bool = True, monitor_state: bool = True
+        self,
+        *,
+        fetch_state: bool = True,
+        monitor_state: bool = True,
+        max_concurrency: int = 4,
+        timeout: float | None = None,
     ) -> None:
         """Initialize all controllers.
 
         Args:
             fetch_state: Whether to fetch the state of stateful objects.
             monitor_state: Whether to keep the state of stateful objects up-to-date.
+            max_concurrency: The maximum number of controllers to initialize at once.
+            timeout: The optional timeout in seconds for each controller to initialize.
         """
-        # Initialize all controllers
+        # Limit the number of controllers initializing at once, since they all share
+        # the same config and command connections
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def initialize_controller(controller: BaseController[Any]) -> None:
+            async with semaphore:
+                await asyncio.wait_for(
+                    controller.initialize(
+                        fetch_state=fetch_state,
+                        monitor_state=monitor_state,
+                    ),
+                    timeout,
+                )
+
+        # Initialize all controllers, constructing any that haven't been used yet
         await asyncio.gather(
             *[
-                controller.initialize(
-                    fetch_state=fetch_state,
-                    monitor_state=monitor_state,
-                )
-                for controller in self._controllers
+                initialize_controller(getattr(self, name))
+                for name in self._controller_names
             ]
         )
 
-    def subscribe(self, callback: EventCallback[SystemObject]) -> Callable[[], None]:
+    def subscribe(
+        self,
+        callback: EventCallback[SystemObject],
+        *,
+        queue_size: int = 64,
+        overflow: OverflowPolicy = "drop_oldest",
+    ) -> Callable[[], None]:
         """Subscribe to state changes for every controller.
 
+        Synchronous callbacks are called directly. Events for async callbacks are
+        delivered in order through a bounded queue, so a slow callback can't build
+        up an unbounded backlog of tasks. This means async callbacks are serialized:
+        a callback isn't called with the next event until it has finished handling
+        the previous one.
+
         Args:
             callback: The callback to call when an object changes.
+            queue_size: The maximum number of queued update events for async
+                callbacks, or 0 for unbounded. Added/deleted events are never dropped.
+            overflow: Whether to drop the oldest or newest update when an async
+                callback's queue is full.
 
         Returns:
             A function to unsubscribe.
         """
-        unsubscribes = [
-            controller.subscribe(callback) for controller in self._controllers
-        ]
+        # Route async callbacks through a bounded queue
+        queue: EventQueue[SystemObject] | None = None
+        if iscoroutinefunction(callback):
+            queue = EventQueue(callback, queue_size, overflow)
+            subscriber: EventHandler[SystemObject] = queue.put
+        else:
+            subscriber = cast(EventHandler[SystemObject], callback)
+
+        self._subscribers.append(subscriber)
 
         def unsubscribe() -> None:
-            for unsub in unsubscribes:
-                unsub()
+            self._subscribers.remove(subscriber)
+            if queue is not None:
+                queue.close()
 
         return unsubscribe
+
+    def _add_controller(self, controller_cls: type[ControllerT]) -> ControllerT:
+        controller = controller_cls(self)
+
+        # Keep the Vantage ID index up to date, and forward events to subscribers
+        controller.subscribe(partial(self._handle_controller_event, controller))
+
+        return controller
+
+    def _handle_controller_event(
+        self,
+        controller: BaseController[Any],
+        event: VantageEvent,
+        obj: SystemObject,
+        data: dict[str, Any],
+    ) -> None:
+        # Track which controller owns each Vantage ID, so lookups are a single dict get
+        if event == VantageEvent.OBJECT_ADDED:
+            self._vid_index[obj.vid] = controller
+        elif event == VantageEvent.OBJECT_DELETED:
+            if self._vid_index.get(obj.vid) is controller:
+                del self._vid_index[obj.vid]
+
+        # Forward the event to subscribers, snapshotting the list in case a callback
+        # subscribes or unsubscribes
+        for subscriber in tuple(self._subscribers):
+            subscriber(event, obj, data)
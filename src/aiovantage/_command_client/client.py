@@ -1,7 +1,9 @@
 import asyncio
 import re
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 from ssl import SSLContext
 from types import TracebackType
 from typing import Any
@@ -9,7 +11,13 @@ from typing import Any
 from typing_extensions import Self
 
 from aiovantage._logger import logger
-from aiovantage.errors import CommandError, raise_command_error
+from aiovantage.errors import (
+    ClientConnectionError,
+    ClientError,
+    ClientTimeoutError,
+    CommandError,
+    raise_command_error,
+)
 
 from .connection import CommandConnection
 from .converter import Converter
@@ -66,19 +74,28 @@ class CommandClient:
         read_timeout: float = 60,
     ) -> None:
         """Initialize the client."""
-        self._connection = CommandConnection(
+        # Each (re)connection gets a new connection object, so that a reader or
+        # writer left over from a previous connection can't touch the new socket
+        self._connection_factory = partial(
+            CommandConnection,
             host,
             port=port,
             ssl=ssl,
             ssl_context_factory=ssl_context_factory,
             conn_timeout=conn_timeout,
         )
+        self._connection = self._connection_factory()
 
         self._username = username
         self._password = password
         self._read_timeout = read_timeout
         self._connection_lock = asyncio.Lock()
-        self._command_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        # Requests waiting for a response on the current connection, in send order,
+        # and requests waiting to be written
+        self._pending: deque[asyncio.Future[list[str]]] = deque()
+        self._write_buffer: list[str] = []
+        self._reader_task: asyncio.Task[None] | None = None
 
     async def __aenter__(self) -> Self:
         """Return context manager."""
@@ -97,6 +114,10 @@ class CommandClient:
 
     def close(self) -> None:
         """Close the connection to the Host Command service."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+
         self._connection.close()
 
     async def command(self, command: str, *params: Any) -> CommandResponse:
@@ -109,10 +130,8 @@ class CommandClient:
         Returns:
             A CommandResponse instance.
         """
-        # Build the request
-        request = command
-        if params:
-            request += " " + " ".join(Converter.serialize(p) for p in params)
+        # Build the request in a single join
+        request = " ".join([command, *map(Converter.serialize, params)])
 
         # Send the request
         *data, return_line = await self.raw_request(request)
@@ -136,53 +155,130 @@ class CommandClient:
             The response lines received from the server.
         """
         conn = await self._get_connection()
+        pending, write_buffer = self._pending, self._write_buffer
+
+        # Queue the command without waiting for earlier responses. The Host Command
+        # service responds to requests in order, so each request queues a future to
+        # be resolved with the next response by the reader task.
+        response: asyncio.Future[list[str]] = asyncio.get_running_loop().create_future()
+        logger.debug("Sending command: %s", request)
+        pending.append(response)
+        write_buffer.append(request)
+
+        try:
+            # The first request in a batch sends it, shielded so that the batch is
+            # still sent if this request is cancelled
+            if len(write_buffer) == 1:
+                await asyncio.shield(self._write_batch(conn, pending, write_buffer))
+
+            # Wait for the response
+            response_lines = await asyncio.wait_for(response, self._read_timeout)
+        except asyncio.TimeoutError as err:
+            # We can no longer tell which response belongs to which request, so
+            # start afresh with a new connection
+            conn.close()
+            raise ClientTimeoutError from err
+        finally:
+            # If we gave up on the response, eg. because we were cancelled while the
+            # batch was being sent, make sure nothing can set an exception on it that
+            # would never be retrieved
+            response.cancel()
+
+        logger.debug("Received response: %s", "\n".join(response_lines))
 
-        # Send the command
-        async with self._command_lock:
-            logger.debug("Sending command: %s", request)
-            await conn.write(f"{request}\n")
+        return response_lines
 
-            # Read all lines of the response
-            response_lines: list[str] = []
+    async def _write_batch(
+        self,
+        conn: CommandConnection,
+        pending: deque[asyncio.Future[list[str]]],
+        write_buffer: list[str],
+    ) -> None:
+        # Yield once, so that requests made concurrently (eg. with asyncio.gather)
+        # can join the batch, then send the whole batch in a single write
+        await asyncio.sleep(0)
+        async with self._write_lock:
+            data = "\n".join(write_buffer) + "\n"
+            write_buffer.clear()
+            try:
+                await conn.write(data)
+            except ClientError as err:
+                # The connection is unusable, so fail everything waiting on it and
+                # close it, so the next request reconnects
+                _fail_pending(pending, err)
+                conn.close()
+
+    async def _read_responses(
+        self,
+        conn: CommandConnection,
+        pending: deque[asyncio.Future[list[str]]],
+    ) -> None:
+        # Read responses from a connection, and hand them to the requests waiting
+        # on it in the order the requests were sent.
+        response_lines: list[str] = []
+        try:
             while True:
-                response_line = await conn.readuntil(b"\r\n", self._read_timeout)
+                response_line = await conn.readuntil(b"\r\n")
                 response_line = response_line.rstrip()
 
-                # Handle command errors
-                if response_line.startswith("R:ERROR"):
-                    # Parse a command error from a message.
-                    match = re.match(r"R:ERROR:(\d+) (.+)", response_line)
-                    if not match:
-                        raise CommandError(response_line)
-
-                    # Convert the error code to a specific exception, if possible
-                    raise_command_error(int(match.group(1)), match.group(2))
-
                 # Ignore potentially interleaved "event" messages
                 if response_line.startswith(("S:", "L:", "EL:")):
                     logger.debug("Ignoring event message: %s", response_line)
                     continue
 
-                # Return the response once we see the response line
+                # Collect lines until we see the response line
                 response_lines.append(response_line)
-                if response_line.startswith("R:"):
-                    break
-
-        logger.debug("Received response: %s", "\n".join(response_lines))
+                if not response_line.startswith("R:"):
+                    continue
 
-        return response_lines
+                if not pending:
+                    logger.warning("Ignoring unexpected response: %s", response_line)
+                else:
+                    # Requests which were cancelled have already given up on theirs
+                    response = pending.popleft()
+                    if not response.done():
+                        if response_line.startswith("R:ERROR"):
+                            response.set_exception(_parse_command_error(response_line))
+                        else:
+                            response.set_result(response_lines)
+
+                response_lines = []
+
+        except ClientError as err:
+            _fail_pending(pending, err)
+        except Exception as err:
+            # Eg. undecodable or oversized data, we can't trust the stream after this
+            logger.exception("Unexpected error reading from Host Command service")
+            _fail_pending(pending, ClientConnectionError(str(err)))
+        finally:
+            # Without a reader the connection is unusable, so close it and fail any
+            # requests still waiting on it
+            conn.close()
+            _fail_pending(pending, ClientConnectionError("Connection closed"))
 
     async def _get_connection(self) -> CommandConnection:
         """Get a connection to the Host Command service."""
         async with self._connection_lock:
             if self._connection.closed:
+                # Stop reading from the previous connection, if any
+                if self._reader_task is not None:
+                    self._reader_task.cancel()
+
                 # Open a new connection
+                self._connection = self._connection_factory()
                 await self._connection.open()
 
                 # Authenticate the new connection if we have credentials
                 if self._username and self._password:
                     await self._connection.authenticate(self._username, self._password)
 
+                # Start reading responses
+                self._pending = deque()
+                self._write_buffer = []
+                self._reader_task = asyncio.create_task(
+                    self._read_responses(self._connection, self._pending)
+                )
+
                 logger.info(
                     "Connected to command client at %s:%d",
                     self._connection.host,
@@ -190,3 +286,26 @@ class CommandClient:
                 )
 
             return self._connection
+
+
+def _fail_pending(pending: deque[asyncio.Future[list[str]]], exc: Exception) -> None:
+    # Fail any requests still waiting for a response
+    while pending:
+        response = pending.popleft()
+        if not response.done():
+            response.set_exception(exc)
+
+
+def _parse_command_error(response_line: str) -> CommandError:
+    # Parse a command error from a message, eg. "R:ERROR:4 Invalid Vid"
+    match = re.match(r"R:ERROR:(\d+) (.+)", response_line)
+    if not match:
+        return CommandError(response_line)
+
+    # Convert the error code to a specific exception, if possible
+    try:
+        raise_command_error(int(match.group(1)), match.group(2))
+    except CommandError as err:
+        return err
+
+    return CommandError(response_line)
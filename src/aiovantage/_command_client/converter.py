@@ -4,6 +4,7 @@ import struct
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from enum import IntEnum
+from functools import lru_cache
 from typing import Any
 
 from typing_extensions import override
@@ -102,6 +103,27 @@ class FloatConverter(BaseConverter):
         return f"{value:.{precision}f}"
 
 
+@lru_cache(maxsize=256)
+def _parse_fixed(value: str) -> Decimal:
+    # Parse a fixed-point value. Telemetry such as temperatures and levels tends to
+    # repeat a small set of values, and Decimal is immutable, so results are cached.
+
+    # Handle both forms of fixed-point values:
+    # - "123.456" (INVOKE replies)
+    # - "123456"  (S:STATUS messages)
+    return Decimal(value.replace(".", "")) / 1000
+
+
+@lru_cache(maxsize=1024)
+def parse_decimal(value: str) -> Decimal:
+    """Parse a plain decimal value, eg. from S:TEMP or S:CURRENT status messages.
+
+    Unlike fixed-point values, these aren't scaled. Sensor readings repeat in the
+    same way as fixed-point values, so results are cached too.
+    """
+    return Decimal(value)
+
+
 class DecimalConverter(BaseConverter):
     """A Decimal converter.
 
@@ -112,10 +134,7 @@ class DecimalConverter(BaseConverter):
     @override
     @staticmethod
     def deserialize(value: str, **kwargs: Any) -> Decimal:
-        # Handle both forms of fixed-point values:
-        # - "123.456" (INVOKE replies)
-        # - "123456"  (S:STATUS messages)
-        return Decimal(value.replace(".", "")) / 1000
+        return _parse_fixed(value)
 
     @override
     @staticmethod
@@ -124,6 +143,10 @@ class DecimalConverter(BaseConverter):
         return f"{value:.{precision}f}"
 
 
+# Integer token regular expression, for byte arrays
+_INT_PATTERN = re.compile(r"-?\d+")
+
+
 class BytesConverter(BaseConverter):
     """A bytes converter.
 
@@ -135,10 +158,10 @@ class BytesConverter(BaseConverter):
     @staticmethod
     def deserialize(value: str, **_kwargs: Any) -> bytes:
         # Extract all integer tokens from the string
-        tokens = [int(x) for x in re.findall(r"-?\d+", value)]
+        tokens = [int(x) for x in _INT_PATTERN.findall(value)]
 
-        # Convert each token to a signed 32-bit integer and concatenate them into bytes
-        return b"".join(struct.pack("i", token) for token in tokens)
+        # Pack the tokens as signed 32-bit integers, in a single call
+        return struct.pack(f"{len(tokens)}i", *tokens)
 
     @override
     @staticmethod
@@ -146,14 +169,11 @@ class BytesConverter(BaseConverter):
         # Pad the data to a multiple of 4 bytes
         value += b"\x00" * (-len(value) % 4)
 
-        # Convert each signed 32-bit integer in the byte array to a string token
-        tokens = [
-            str(struct.unpack("i", value[i : i + 4])[0])
-            for i in range(0, len(value), 4)
-        ]
+        # Unpack the byte array as signed 32-bit integers, in a single call
+        tokens = struct.unpack(f"{len(value) // 4}i", value)
 
         # Join the tokens with commas and wrap in curly braces
-        return "{" + ",".join(tokens) + "}"
+        return "{" + ",".join(map(str, tokens)) + "}"
 
 
 class DateTimeConverter(BaseConverter):
@@ -173,6 +193,24 @@ class DateTimeConverter(BaseConverter):
         return str(int(value.timestamp()))
 
 
+@lru_cache(maxsize=256)
+def _parse_enum(enum_type: type[IntEnum], value: str) -> IntEnum:
+    # Parse an enum value. Enum responses come from a small, fixed set of values,
+    # so results are cached to skip the EnumMeta lookup machinery.
+
+    # Handle integer representations of enum values
+    if value.isdigit():
+        return enum_type(int(value))
+
+    # Handle string representations of enum values, falling back to an "Unknown"
+    # member for unrecognized names if the enum has one
+    members = enum_type.__members__
+    if value not in members and "Unknown" in members:
+        return members["Unknown"]
+
+    return members[value]
+
+
 class IntEnumConverter(BaseConverter):
     """An IntEnum converter.
 
@@ -189,12 +227,7 @@ class IntEnumConverter(BaseConverter):
         if enum_type is None or not issubclass(enum_type, IntEnum):
             raise ValueError("IntEnumConverter requires a data_type argument")
 
-        # Handle integer representations of enum values
-        if value.isdigit():
-            return enum_type(int(value))
-
-        # Handle string representations of enum values.
-        return enum_type[value]
+        return _parse_enum(enum_type, value)
 
     @override
     @staticmethod
@@ -217,7 +250,12 @@ CONVERTER_MAP: dict[type, type[BaseConverter]] = {
 }
 
 
+@lru_cache(maxsize=128)
 def _get_converter(data_type: type) -> type[BaseConverter]:
+    # Resolve the converter for a data type. Responses for a given method always
+    # have the same type, so resolutions are cached rather than walking the MRO of
+    # eg. every enum type on every response.
+
     # Check if the data type is directly registered
     if data_type in CONVERTER_MAP:
         return CONVERTER_MAP[data_type]
@@ -278,4 +316,9 @@ class Converter:
         Returns:
             A list of string tokens.
         """
+        # Most messages are plain whitespace-separated words, which str.split handles
+        # several times faster than the regular expression
+        if '"' not in string and "{" not in string and "[" not in string:
+            return string.split()
+
         return [match.group(0) for match in TOKEN_PATTERN.finditer(string)]
@@ -1,8 +1,10 @@
 import asyncio
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from ssl import SSLContext
 from types import TracebackType
-from typing import Protocol, TypeVar
+from typing import Any, Protocol, TypeVar
 
 from typing_extensions import Self
 from xsdata.formats.dataclass.context import XmlContext
@@ -18,6 +20,11 @@ from aiovantage.errors import ClientResponseError, LoginRequiredError
 
 from .connection import ConfigConnection
 
+# The connection pinned by ConfigClient.session, and the task that pinned it
+_session: ContextVar[tuple[asyncio.Task[Any], ConfigConnection] | None] = ContextVar(
+    "_session", default=None
+)
+
 Interface = TypeVar("Interface")
 Call = TypeVar("Call")
 Return = TypeVar("Return")
@@ -34,6 +41,8 @@ class ConfigClient:
     """Client for the Vantage Application Communication Interface (ACI) service.
 
     Connections are created lazily when needed, and closed when the client is closed.
+    Requests are sent over a pool of one or more connections, so that concurrent
+    requests don't need to wait for each other.
 
     Args:
         host: The hostname or IP address of the Vantage controller.
@@ -44,6 +53,7 @@ class ConfigClient:
         port: The port to connect to.
         conn_timeout: The connection timeout in seconds.
         read_timeout: The read timeout in seconds.
+        pool_size: The maximum number of connections to open.
     """
 
     def __init__(
@@ -57,21 +67,29 @@ class ConfigClient:
         port: int | None = None,
         conn_timeout: float = 30,
         read_timeout: float = 60,
+        pool_size: int = 1,
     ) -> None:
         """Initialize the client."""
-        self._connection = ConfigConnection(
-            host,
-            port=port,
-            ssl=ssl,
-            ssl_context_factory=ssl_context_factory,
-            conn_timeout=conn_timeout,
-        )
+        self._connections = [
+            ConfigConnection(
+                host,
+                port=port,
+                ssl=ssl,
+                ssl_context_factory=ssl_context_factory,
+                conn_timeout=conn_timeout,
+            )
+            for _ in range(max(pool_size, 1))
+        ]
+
+        # Connections not currently in use by a request
+        self._idle_connections: asyncio.Queue[ConfigConnection] = asyncio.Queue()
+        for connection in self._connections:
+            self._idle_connections.put_nowait(connection)
 
         self._username = username
         self._password = password
         self._read_timeout = read_timeout
         self._connection_lock = asyncio.Lock()
-        self._request_lock = asyncio.Lock()
 
         # Default to pascal case for element and attribute names
         xml_context = XmlContext(
@@ -118,12 +136,9 @@ class ConfigClient:
         Returns:
             The raw XML response.
         """
-        # Open the connection if it's closed
-        conn = await self._get_connection()
-
         # Send the request and read the response
         logger.debug("Sending request: %s", request)
-        async with self._request_lock:
+        async with self._acquire_connection() as conn:
             await conn.write(request)
             response = await conn.readuntil(separator.encode(), self._read_timeout)
 
@@ -177,32 +192,63 @@ class ConfigClient:
 
         return method_response.result
 
-    def close(self) -> None:
-        """Close the connection to the ACI service."""
-        self._connection.close()
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[None]:
+        """Send all requests made by the current task over a single connection.
 
-    async def _get_connection(self) -> ConfigConnection:
-        """Get a connection to the ACI service."""
+        Use this for sequences of requests which rely on per-connection state, such
+        as filter handles. The connection is unavailable to other requests until the
+        session ends, so don't hold a session open across a `yield` in an async
+        generator.
+        """
+        async with self._acquire_connection() as conn:
+            token = _session.set((asyncio.current_task(), conn))  # type: ignore
+            try:
+                yield
+            finally:
+                _session.reset(token)
+
+    def close(self) -> None:
+        """Close the connections to the ACI service."""
+        for connection in self._connections:
+            connection.close()
+
+    @asynccontextmanager
+    async def _acquire_connection(self) -> AsyncIterator[ConfigConnection]:
+        """Get exclusive use of a connection to the ACI service."""
+        # Use the connection pinned by a session, if we're in one
+        session = _session.get()
+        if session is not None:
+            task, conn = session
+            if task is asyncio.current_task() and conn in self._connections:
+                yield conn
+                return
+
+        # Otherwise, wait for an idle connection from the pool
+        conn = await self._idle_connections.get()
+        try:
+            yield await self._get_connection(conn)
+        finally:
+            self._idle_connections.put_nowait(conn)
+
+    async def _get_connection(self, conn: ConfigConnection) -> ConfigConnection:
+        """Get an open connection to the ACI service."""
         async with self._connection_lock:
-            if self._connection.closed:
+            if conn.closed:
                 # Open a new connection
-                await self._connection.open()
+                await conn.open()
 
                 # Authenticate the new connection if we have credentials
                 if self._username and self._password:
-                    await self._connection.authenticate(self._username, self._password)
-                elif self._connection.requires_authentication:
+                    await conn.authenticate(self._username, self._password)
+                elif conn.requires_authentication:
                     raise LoginRequiredError(
                         "Login required, but no credentials were provided"
                     )
 
-                logger.info(
-                    "Connected to config client at %s:%d",
-                    self._connection.host,
-                    self._connection.port,
-                )
+                logger.info("Connected to config client at %s:%d", conn.host, conn.port)
 
-            return self._connection
+            return conn
 
 
 def _pascal_case_preserve(name: str) -> str:
@@ -1,10 +1,30 @@
 import re
+from xml.sax.saxutils import escape
 
 from typing_extensions import override
 
 from aiovantage._connection import BaseConnection
 from aiovantage.errors import ClientConnectionError, LoginFailedError
 
+# These messages are small and fixed, so they are formatted and matched directly
+# rather than going through the XML serializer and parser
+_LOGIN_TEMPLATE = (
+    "<ILogin><Login><call><User>{username}</User>"
+    "<Password>{password}</Password></call></Login></ILogin>\n"
+)
+
+_LOGIN_RESPONSE_PATTERN = re.compile(
+    r"<ILogin>\s*<Login>\s*<return>\s*"
+    r"(true|false)\s*"
+    r"</return>\s*</Login>\s*</ILogin>"
+)
+
+_SYSINFO_RESPONSE_PATTERN = re.compile(
+    r"<IIntrospection>\s*<GetSysInfo>\s*<return>\s*"
+    r"<SysInfo>.*</SysInfo>\s*"
+    r"</return>\s*</GetSysInfo>\s*</IIntrospection>"
+)
+
 
 class ConfigConnection(BaseConnection):
     """Connection to a Vantage ACI server."""
@@ -36,22 +56,17 @@ class ConfigConnection(BaseConnection):
             username: The username to use for authentication.
             password: The password to use for authentication.
         """
-        # Call the ILogin.Login method
+        # Call the ILogin.Login method, escaping the credentials so that characters
+        # like "&" and "<" don't produce malformed XML
         await self.write(
-            f"<ILogin><Login><call><User>{username}</User>"
-            f"<Password>{password}</Password></call></Login></ILogin>\n"
+            _LOGIN_TEMPLATE.format(username=escape(username), password=escape(password))
         )
 
         # Fetch the response
         response = await self.readuntil(b"</ILogin>\n")
 
         # Parse the response
-        match = re.match(
-            r"<ILogin>\s*<Login>\s*<return>\s*"
-            r"(true|false)\s*"
-            r"</return>\s*</Login>\s*</ILogin>",
-            response,
-        )
+        match = _LOGIN_RESPONSE_PATTERN.match(response)
 
         if not match:
             raise LoginFailedError("Failed to parse login response")
@@ -86,12 +101,7 @@ class ConfigConnection(BaseConnection):
 
         # Responses containing the SysInfo element indicate a successful request
         # and therefore no authentication is required
-        if re.match(
-            r"<IIntrospection>\s*<GetSysInfo>\s*<return>\s*"
-            r"<SysInfo>.*</SysInfo>\s*"
-            r"</return>\s*</GetSysInfo>\s*</IIntrospection>",
-            response,
-        ):
+        if _SYSINFO_RESPONSE_PATTERN.match(response):
             return False
 
         return True
@@ -1,6 +1,6 @@
 """IConfiguration interfaces."""
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator
 from contextlib import suppress
 from dataclasses import dataclass, field
 from typing import Any, TypeVar, overload
@@ -169,13 +169,13 @@ class ConfigurationInterface:
     @staticmethod
     def get_objects(
         client: ConfigClient, *types: str, xpath: str | None = None, as_type: type[T]
-    ) -> AsyncIterator[T]: ...
+    ) -> AsyncGenerator[T, None]: ...
 
     @overload
     @staticmethod
     def get_objects(
         client: ConfigClient, *types: str, xpath: str | None = None
-    ) -> AsyncIterator[Any]: ...
+    ) -> AsyncGenerator[Any, None]: ...
 
     @staticmethod
     async def get_objects(
@@ -183,7 +183,7 @@ class ConfigurationInterface:
         *types: str,
         xpath: str | None = None,
         as_type: type[T] | None = None,
-    ) -> AsyncIterator[T | Any]:
+    ) -> AsyncGenerator[T | Any, None]:
         """Get Vantage objects, optionally filtered by a type and/or an XPath.
 
         This is a convenience function that wraps the open_filter, get_filter_results
@@ -196,20 +196,30 @@ class ConfigurationInterface:
             as_type: The type to verify the objects as
 
         Yields:
-            A stream of Vantage objects
+            The matching Vantage objects
         """
-        # Open the filter
-        handle = await ConfigurationInterface.open_filter(client, *types, xpath=xpath)
-
-        try:
-            # Fetch the results
-            while objects := await ConfigurationInterface.get_filter_results(
-                client, handle
-            ):
-                for obj in objects:
-                    if as_type is None or isinstance(obj.obj, as_type):
-                        yield obj.obj
-        finally:
-            # Close the filter
-            with suppress(ClientError):
-                await ConfigurationInterface.close_filter(client, handle)
+        # Filter handles may be tied to the connection they were opened on, so the
+        # whole sequence runs in a single session. Objects are only yielded once
+        # the session has ended, so the connection isn't held while the caller
+        # processes them.
+        results: list[GetFilterResults.Object] = []
+        async with client.session():
+            # Open the filter
+            handle = await ConfigurationInterface.open_filter(
+                client, *types, xpath=xpath
+            )
+
+            try:
+                # Fetch the results
+                while objects := await ConfigurationInterface.get_filter_results(
+                    client, handle
+                ):
+                    results.extend(objects)
+            finally:
+                # Close the filter
+                with suppress(ClientError):
+                    await ConfigurationInterface.close_filter(client, handle)
+
+        for obj in results:
+            if as_type is None or isinstance(obj.obj, as_type):
+                yield obj.obj
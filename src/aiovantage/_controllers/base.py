@@ -9,7 +9,13 @@ from aiovantage.command_client import Converter, Event, EventType
 from aiovantage.config_client import ConfigurationInterface
 from aiovantage.objects import SystemObject
 
-from .events import EventCallback, VantageEvent
+from .events import (
+    EventCallback,
+    EventHandler,
+    EventQueue,
+    OverflowPolicy,
+    VantageEvent,
+)
 from .query import QuerySet
 
 if TYPE_CHECKING:
@@ -18,7 +24,7 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound=SystemObject)
 
 
-EventSubscription = tuple[EventCallback[T], Iterable[VantageEvent] | None]
+EventSubscription = tuple[EventHandler[T], Iterable[VantageEvent] | None]
 
 
 class BaseController(QuerySet[T]):
@@ -177,13 +183,26 @@ class BaseController(QuerySet[T]):
         callback: EventCallback[T],
         id_filter: int | Iterable[int] | None = None,
         event_filter: VantageEvent | Iterable[VantageEvent] | None = None,
+        *,
+        queue_size: int = 64,
+        overflow: OverflowPolicy = "drop_oldest",
     ) -> Callable[[], None]:
         """Subscribe to status changes for objects managed by this controller.
 
+        Synchronous callbacks are called directly. Events for async callbacks are
+        delivered in order through a bounded queue, so a slow callback can't build
+        up an unbounded backlog of tasks. This means async callbacks are serialized:
+        a callback isn't called with the next event until it has finished handling
+        the previous one.
+
         Args:
             callback: The callback to call when an object changes.
             id_filter: The Vantage IDs to subscribe to, all objects if None.
             event_filter: The event types to subscribe to, all events if None.
+            queue_size: The maximum number of queued update events for async
+                callbacks, or 0 for unbounded. Added/deleted events are never dropped.
+            overflow: Whether to drop the oldest or newest update when an async
+                callback's queue is full.
 
         Returns:
             A function to unsubscribe from the callback.
@@ -195,8 +214,13 @@ class BaseController(QuerySet[T]):
         if isinstance(event_filter, VantageEvent):
             event_filter = (event_filter,)
 
-        # Create the subscription
-        subscription = (callback, event_filter)
+        # Route async callbacks through a bounded queue
+        queue: EventQueue[T] | None = None
+        if iscoroutinefunction(callback):
+            queue = EventQueue(callback, queue_size, overflow)
+            subscription: EventSubscription[T] = (queue.put, event_filter)
+        else:
+            subscription = (cast(EventHandler[T], callback), event_filter)
 
         # Add the subscription to the list of subscriptions
         if id_filter is None:
@@ -217,6 +241,9 @@ class BaseController(QuerySet[T]):
                         continue
                     self._id_subscriptions[vid].remove(subscription)
 
+            if queue is not None:
+                queue.close()
+
         return unsubscribe
 
     def _emit(
@@ -232,10 +259,7 @@ class BaseController(QuerySet[T]):
             if event_filter is not None and event_type not in event_filter:
                 continue
 
-            if iscoroutinefunction(callback):
-                asyncio.create_task(callback(event_type, obj, data))  # noqa: RUF006
-            else:
-                callback(event_type, obj, data)
+            callback(event_type, obj, data)
 
     def _object_updated(self, obj: T, *attrs_changed: str) -> None:
         # Notify subscribers that an object has been updated
@@ -1,7 +1,10 @@
+import asyncio
+from collections import deque
 from collections.abc import Awaitable, Callable
 from enum import Enum
-from typing import Any, TypeAlias, TypeVar
+from typing import Any, Generic, Literal, TypeAlias, TypeVar, cast
 
+from aiovantage._logger import logger
 from aiovantage.objects import SystemObject
 
 
@@ -24,3 +27,110 @@ EventCallback: TypeAlias = Callable[
     [VantageEvent, T, dict[str, Any]], None | Awaitable[None]
 ]
 """Type alias for a Vantage event callback function."""
+
+EventHandler: TypeAlias = Callable[[VantageEvent, T, dict[str, Any]], None]
+"""Type alias for a synchronous event handler, as called when dispatching events."""
+
+OverflowPolicy: TypeAlias = Literal["drop_oldest", "drop_newest"]
+"""What to drop when an async subscriber's event queue is full."""
+
+
+class EventQueue(Generic[T]):
+    """Bounded queue for delivering events to an async callback.
+
+    Events are delivered in order by a single worker task, so a slow callback can't
+    pile up an unbounded number of tasks, and isn't called again until its previous
+    call has finished. When the queue is full, either the oldest queued update or the
+    incoming update is dropped, depending on the overflow policy.
+
+    Object added/deleted events are never dropped, and never make room by dropping
+    an update, so the queue size only bounds update events: added/deleted events
+    are queued beyond the bound when the queue is full.
+    """
+
+    def __init__(
+        self,
+        callback: EventCallback[T],
+        queue_size: int = 64,
+        overflow: OverflowPolicy = "drop_oldest",
+    ) -> None:
+        """Initialize an event queue.
+
+        Args:
+            callback: The async callback to deliver events to.
+            queue_size: The maximum number of queued events, or 0 for unbounded.
+                Added/deleted events may exceed this, since they're never dropped.
+            overflow: Whether to drop the oldest or newest update when full.
+        """
+        self._callback = callback
+        self._queue_size = queue_size
+        self._overflow = overflow
+        self._events: deque[tuple[VantageEvent, T, dict[str, Any]]] = deque()
+        self._ready = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+        self._closed = False
+
+    def put(self, event_type: VantageEvent, obj: T, data: dict[str, Any]) -> None:
+        """Queue an event for delivery to the callback."""
+        # Ignore events emitted after unsubscribing, eg. by a controller that's
+        # still iterating over a snapshot of its subscriptions
+        if self._closed:
+            return
+
+        # Start the worker lazily, since it needs a running event loop
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+        if 0 < self._queue_size <= len(self._events) and not self._make_room(
+            event_type
+        ):
+            return
+
+        self._events.append((event_type, obj, data))
+        self._ready.set()
+
+    def close(self) -> None:
+        """Stop delivering events, discarding any that are queued.
+
+        A callback that closes its own queue, eg. by unsubscribing, isn't cancelled,
+        and runs to completion before the worker exits.
+        """
+        self._closed = True
+        self._events.clear()
+
+        if self._worker is not None and self._worker is not asyncio.current_task():
+            self._worker.cancel()
+
+        self._worker = None
+
+    def _make_room(self, event_type: VantageEvent) -> bool:
+        # Apply the overflow policy to a full queue, returning False if the
+        # incoming event should be dropped
+        if event_type != VantageEvent.OBJECT_UPDATED:
+            return True
+
+        name = getattr(self._callback, "__qualname__", self._callback)
+        if self._overflow == "drop_newest":
+            logger.warning("Event queue full for %s, dropping newest update", name)
+            return False
+
+        for i, (queued_type, _obj, _data) in enumerate(self._events):
+            if queued_type == VantageEvent.OBJECT_UPDATED:
+                del self._events[i]
+                logger.warning("Event queue full for %s, dropping oldest update", name)
+                break
+
+        return True
+
+    async def _run(self) -> None:
+        # Deliver queued events to the callback, one at a time, until closed
+        while not self._closed:
+            await self._ready.wait()
+            while self._events and not self._closed:
+                event_type, obj, data = self._events.popleft()
+                try:
+                    await cast(Awaitable[None], self._callback(event_type, obj, data))
+                except Exception:
+                    logger.exception("Error in event callback")
+
+            self._ready.clear()
@@ -1,10 +1,68 @@
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from aiovantage.command_client import Event
 from aiovantage.objects import GMem
 
 from .base import BaseController
 
+if TYPE_CHECKING:
+    from aiovantage import Vantage
+
 
 class GMemController(BaseController[GMem]):
     """GMem (variables) controller."""
 
     vantage_types = ("GMem",)
     category_status = True
+
+    def __init__(self, vantage: "Vantage") -> None:
+        """Initialize a GMem controller.
+
+        Args:
+            vantage: The Vantage instance.
+        """
+        super().__init__(vantage)
+
+        # Whether VARIABLE status messages are keeping variable values current.
+        # Cleared when the event stream reconnects, since updates may have been
+        # missed while it was disconnected.
+        self._values_current = False
+
+    @override
+    async def fetch_state(self, *, force: bool = False) -> None:
+        """Fetch the state properties of all objects managed by this controller.
+
+        While monitoring state, variable values are kept current by the event stream,
+        so only variables without a value yet are fetched.
+
+        Args:
+            force: Fetch the values of all variables, even if they are current.
+        """
+        if force or not self._values_current:
+            await super().fetch_state()
+
+            # Once fetched, values stay current for as long as we're monitoring
+            self._values_current = self._subscribed_to_state_changes
+            return
+
+        # Skip the GETVARIABLE request for variables we already have a value for
+        for obj in self._items.values():
+            if obj.value is not None:
+                continue
+
+            props_changed = await obj.fetch_state()
+            if props_changed:
+                self._object_updated(obj, *props_changed)
+
+    @override
+    async def monitor_state(self) -> None:
+        await super().monitor_state()
+        self._values_current = True
+
+    @override
+    def _handle_reconnect_event(self, event: Event) -> None:
+        # Values may have changed while we were disconnected, so fetch them all
+        self._values_current = False
+        super()._handle_reconnect_event(event)
@@ -1,7 +1,10 @@
+from collections.abc import Iterator, Mapping, ValuesView
+
 from aiovantage._controllers.query import QuerySet
 from aiovantage.objects import Load, LoadGroup
 
 from .base import BaseController
+from .loads import LoadsController
 
 
 class LoadGroupsController(BaseController[LoadGroup]):
@@ -11,6 +14,55 @@ class LoadGroupsController(BaseController[LoadGroup]):
 
     def loads(self, vid: int) -> QuerySet[Load]:
         """Return a queryset of all loads in this load group."""
-        load_group = self[vid]
+        loads = self._vantage.loads
+
+        async def populate() -> None:
+            # Populate the loads controller, if it hasn't been already
+            if not loads.initialized:
+                await loads.initialize()
+
+        return QuerySet(_GroupLoads(loads, self[vid]), populate)
+
+
+class _GroupLoads(Mapping[int, Load]):
+    # Live view of the loads in a load group, in load table order. The load table
+    # is the group's membership index, so each query only looks up the group's
+    # own loads, rather than testing every load in the system for membership.
+
+    def __init__(self, loads: LoadsController, load_group: LoadGroup) -> None:
+        self._loads = loads
+        self._load_group = load_group
+
+    def __getitem__(self, vid: int) -> Load:
+        if vid not in self._load_group.load_table_set:
+            raise KeyError(vid)
+
+        return self._loads[vid]
+
+    def __iter__(self) -> Iterator[int]:
+        # Skip loads that are in the load table, but not known to the controller.
+        # The loads controller is bound to a local once, rather than looked up for
+        # every entry.
+        loads = self._loads
+        return (vid for vid in self._load_group.load_table if vid in loads)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def values(self) -> ValuesView[Load]:
+        return _GroupLoadsValues(self, self._loads)
+
+
+class _GroupLoadsValues(ValuesView[Load]):
+    # Loads in a load group. The generic view looks each load up through
+    # __getitem__, which tests load table membership again for every load, so
+    # resolve the load table entries directly instead.
+
+    def __init__(self, group_loads: _GroupLoads, loads: LoadsController) -> None:
+        super().__init__(group_loads)
+        self._group_loads = group_loads
+        self._loads = loads
 
-        return self._vantage.loads.filter(lambda load: load.id in load_group.load_table)
+    def __iter__(self) -> Iterator[Load]:
+        loads = self._loads
+        return (loads[vid] for vid in self._group_loads)
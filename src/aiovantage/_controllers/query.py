@@ -1,4 +1,11 @@
-from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
 from typing import Any, TypeVar, cast, overload
 
 from typing_extensions import Self
@@ -8,7 +15,7 @@ U = TypeVar("U")
 
 
 class QuerySet(Iterable[T], AsyncIterator[T]):
-    """Queryset class for querying objects from a dictionary.
+    """Queryset class for querying objects from a mapping.
 
     Querysets are iterable and async iterable, and can be chained together to
     filter objects.
@@ -16,14 +23,14 @@ class QuerySet(Iterable[T], AsyncIterator[T]):
 
     def __init__(
         self,
-        data: dict[int, T],
+        data: Mapping[int, T],
         populate: Callable[[], Awaitable[None]],
         filters: list[Callable[[T], Any]] | None = None,
     ) -> None:
         """Initialize a queryset.
 
         Args:
-            data: The data dictionary to query.
+            data: The data mapping to query, by Vantage ID.
             populate: A coroutine to populate the data so we don't have a complete
                       dataset before using "async for" loops.
             filters: A list of filters to apply to the queryset.
@@ -39,9 +46,7 @@ class QuerySet(Iterable[T], AsyncIterator[T]):
 
     def __iter__(self) -> Iterator[T]:
         """Return an iterator over the queryset."""
-        for obj in self._data.values():
-            if all(filter_fn(obj) for filter_fn in self.__filters):
-                yield obj
+        return self._filtered(self._data.values())
 
     def __bool__(self) -> bool:
         """Return True if the queryset contains any objects."""
@@ -57,13 +62,21 @@ class QuerySet(Iterable[T], AsyncIterator[T]):
         if self.__iterator is None:
             await self._populate()
 
-            self.__iterator = iter(self)
+            # Iterate over a snapshot, since objects can be added or removed while
+            # the caller awaits between items
+            self.__iterator = self._filtered(list(self._data.values()))
 
         try:
             return next(self.__iterator)
         except StopIteration as exc:
             raise StopAsyncIteration from exc
 
+    def _filtered(self, objects: Iterable[T]) -> Iterator[T]:
+        # Yield the objects that match every filter
+        for obj in objects:
+            if all(filter_fn(obj) for filter_fn in self.__filters):
+                yield obj
+
     @overload
     def filter(self, match: Callable[[T], Any]) -> "QuerySet[T]": ...
 
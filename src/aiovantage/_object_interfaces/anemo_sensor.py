@@ -1,8 +1,6 @@
 from decimal import Decimal
 
-from typing_extensions import override
-
-from .base import Interface, method
+from .base import Interface, category, method
 
 
 class AnemoSensorInterface(Interface):
@@ -44,11 +42,8 @@ class AnemoSensorInterface(Interface):
             "AnemoSensor.SetSpeedSW" if sw else "AnemoSensor.SetSpeed", speed
         )
 
-    @override
-    def handle_category_status(self, category: str, *args: str) -> list[str]:
-        if category == "WIND":
-            # STATUS WIND
-            # -> S:WIND <id> <wind_speed>
-            return self.update_properties({"speed": Decimal(args[0])})
-
-        return super().handle_category_status(category, *args)
+    @category("WIND")
+    def _handle_wind_status(self, *args: str) -> list[str]:
+        # STATUS WIND
+        # -> S:WIND <id> <wind_speed>
+        return self.update_properties({"speed": Decimal(args[0])})
@@ -15,6 +15,22 @@ from aiovantage.errors import NotImplementedError, NotSupportedError
 
 T = TypeVar("T")
 
+# Sentinel for properties an object doesn't have
+_MISSING = object()
+
+
+def _get_output_value(method: str, out: str, result: str, args: tuple[str, ...]) -> str:
+    # Grab either the result or an argument based on "out" metadata field
+    if out == "return":
+        return result
+
+    if out.startswith("arg") and out[3:].isdigit():
+        index = int(out[3:])
+        if 0 <= index < len(args):
+            return args[index]
+
+    raise ValueError(f"Invalid 'out' metadata when parsing {method}")
+
 
 class _AsyncCallable(Protocol):
     async def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
@@ -27,6 +43,13 @@ class _MethodCallable(Protocol):
     async def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
 
 
+@runtime_checkable
+class _CategoryCallable(Protocol):
+    category_metadata: list[str]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
+
+
 def method(
     *methods: str, out: str | None = None, property: str | None = None
 ) -> Callable[[T], T]:
@@ -62,6 +85,32 @@ def method(
     return decorator
 
 
+def category(*categories: str) -> Callable[[T], T]:
+    """Decorator to annotate a function as a category status message handler.
+
+    This is used to dispatch "legacy" status messages from the Host Command
+    service, eg. "S:LOAD", straight to the function that handles them, rather
+    than checking the category in every interface an object implements.
+
+    The function is called with the arguments of the status message, and should
+    return a list of property names that were updated.
+
+    Args:
+        categories: The status category name(s) to associate with the function.
+    """
+
+    def decorator(func: T) -> T:
+        # Attach metadata to the function
+        metadata: list[str] = getattr(func, "category_metadata", [])
+        metadata.extend(categories)
+
+        func.category_metadata = metadata  # type: ignore
+
+        return func
+
+    return decorator
+
+
 class _InterfaceMeta(type):
     """Metaclass to collect method metadata from member functions and base classes."""
 
@@ -76,6 +125,7 @@ class _InterfaceMeta(type):
         method_output: dict[str, str] = {}
         method_properties: dict[str, str] = {}
         property_getters: dict[str, _AsyncCallable] = {}
+        category_handlers: dict[str, _CategoryCallable] = {}
 
         # Include method metadata from base classes
         for base in bases:
@@ -85,8 +135,18 @@ class _InterfaceMeta(type):
                 method_properties.update(base._method_properties)  # type: ignore
                 property_getters.update(base._property_getters)  # type: ignore
 
+        # Include category handlers from base classes, earlier bases taking
+        # precedence as they would when resolving an overridden method
+        for base in reversed(bases):
+            if issubclass(base, Interface):
+                category_handlers.update(base._category_handlers)  # type: ignore
+
         # Collect method metadata from member functions
         for attr in dct.values():
+            if isinstance(attr, _CategoryCallable):
+                for category in attr.category_metadata:
+                    category_handlers[category] = attr
+
             if not isinstance(attr, _MethodCallable):
                 continue
 
@@ -116,6 +176,7 @@ class _InterfaceMeta(type):
         dct["_method_output"] = method_output
         dct["_method_properties"] = method_properties
         dct["_property_getters"] = property_getters
+        dct["_category_handlers"] = category_handlers
 
         return super().__new__(cls, name, bases, dct)
 
@@ -137,6 +198,7 @@ class Interface(metaclass=_InterfaceMeta):
     _method_output: dict[str, str]
     _method_properties: dict[str, str]
     _property_getters: dict[str, _AsyncCallable]
+    _category_handlers: dict[str, _CategoryCallable]
 
     @overload
     async def invoke(self, method: str, *params: Any) -> Any: ...
@@ -161,10 +223,11 @@ class Interface(metaclass=_InterfaceMeta):
         if not self.command_client:
             raise ValueError("The object has no command client to send requests with.")
 
-        # Build the request
-        request = f"INVOKE {self.vid} {method}"
-        if params:
-            request += " " + " ".join(Converter.serialize(p) for p in params)
+        # Build the request in a single join, rather than formatting the prefix and
+        # then concatenating the serialized parameters onto it
+        request = " ".join(
+            ["INVOKE", str(self.vid), method, *map(Converter.serialize, params)]
+        )
 
         # Send the request
         response = await self.command_client.raw_request(request)
@@ -185,9 +248,11 @@ class Interface(metaclass=_InterfaceMeta):
         Returns:
             A list of property names that were updated.
         """
+        # Status handlers call this for every event, so look each property up once
         changed: list[str] = []
         for prop, value in properties.items():
-            if hasattr(self, prop) and getattr(self, prop) != value:
+            current = getattr(self, prop, _MISSING)
+            if current is not _MISSING and current != value:
                 setattr(self, prop, value)
                 changed.append(prop)
 
@@ -248,7 +313,8 @@ class Interface(metaclass=_InterfaceMeta):
         """Handle category status messages.
 
         Object interfaces which can handle "legacy" status messages from the
-        Host Command service should override this method.
+        Host Command service should register handlers with the `category`
+        decorator.
 
         Args:
             category: The category of the status message, eg. "LOAD".
@@ -257,7 +323,12 @@ class Interface(metaclass=_InterfaceMeta):
         Returns:
             A list of property names that were updated.
         """
-        return []
+        # Look up the handler registered for this category
+        handler = self._category_handlers.get(category)
+        if handler is None:
+            return []
+
+        return handler(self, *args)
 
     @classmethod
     def _parse_object_response(
@@ -279,18 +350,6 @@ class Interface(metaclass=_InterfaceMeta):
         if signature in (None, type(None)):
             return None
 
-        # Grab either the result or an argument based on "out" metadata field
-        def get_output_value(out: str) -> Any:
-            if out == "return":
-                return result
-
-            if out.startswith("arg") and out[3:].isdigit():
-                index = int(out[3:])
-                if 0 <= index < len(args):
-                    return args[index]
-
-            raise ValueError(f"Invalid 'out' metadata when parsing {method}")
-
         # Parse the response based on the expected return type
         if is_dataclass(signature):
             # If the method returns a dataclass, parse the result and/or arguments
@@ -308,11 +367,14 @@ class Interface(metaclass=_InterfaceMeta):
                     raise ValueError(f"Field {field.name} missing type hint")
 
                 props[field.name] = Converter.deserialize(
-                    field_signature, get_output_value(out)
+                    field_signature, _get_output_value(method, out, result, args)
                 )
 
             return signature(**props)
         else:
             # Otherwise, parse the result into the expected type
-            out = cls._method_output.get(method, "return")
-            return Converter.deserialize(signature, get_output_value(out))
+            out = cls._method_output.get(method)
+            return Converter.deserialize(
+                signature,
+                result if out is None else _get_output_value(method, out, result, args),
+            )
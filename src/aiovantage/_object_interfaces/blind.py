@@ -1,9 +1,7 @@
 from dataclasses import dataclass, field
 from decimal import Decimal
 
-from typing_extensions import override
-
-from .base import Interface, method
+from .base import Interface, category, method
 from .fields import ShadeOrientation, ShadeType
 
 
@@ -237,11 +235,8 @@ class BlindInterface(Interface, ShadeOrientation, ShadeType):
         # -> R:INVOKE <id> <openTime> <closeTime> Blind.GetTravelTimes
         return await self.invoke("Blind.GetTravelTimes")
 
-    @override
-    def handle_category_status(self, category: str, *args: str) -> list[str]:
-        if category == "BLIND":
-            # STATUS BLIND
-            # -> S:BLIND <id> <position (0.000 - 100.000)>
-            return self.update_properties({"position": Decimal(args[0])})
-
-        return super().handle_category_status(category, *args)
+    @category("BLIND")
+    def _handle_blind_status(self, *args: str) -> list[str]:
+        # STATUS BLIND
+        # -> S:BLIND <id> <position (0.000 - 100.000)>
+        return self.update_properties({"position": Decimal(args[0])})
@@ -1,9 +1,7 @@
 from decimal import Decimal
 from enum import IntEnum
 
-from typing_extensions import override
-
-from .base import Interface, method
+from .base import Interface, category, method
 
 
 class ButtonInterface(Interface):
@@ -191,16 +189,15 @@ class ButtonInterface(Interface):
         """Return True if the button is down."""
         return self.state == self.State.Down
 
-    @override
-    def handle_category_status(self, category: str, *args: str) -> list[str]:
-        if category == "BTN":
-            # STATUS BTN
-            # -> S:BTN <id> <state (PRESS/RELEASE)>
-            btn_map = {
-                "PRESS": ButtonInterface.State.Down,
-                "RELEASE": ButtonInterface.State.Up,
-            }
+    @category("BTN")
+    def _handle_btn_status(self, *args: str) -> list[str]:
+        # STATUS BTN
+        # -> S:BTN <id> <state (PRESS/RELEASE)>
+        return self.update_properties({"state": _BTN_MAP[args[0]]})
 
-            return self.update_properties({"state": btn_map[args[0]]})
 
-        return super().handle_category_status(category, *args)
+# Category status values, mapped to their button states
+_BTN_MAP = {
+    "PRESS": ButtonInterface.State.Down,
+    "RELEASE": ButtonInterface.State.Up,
+}
@@ -1,8 +1,8 @@
 from decimal import Decimal
 
-from typing_extensions import override
+from aiovantage.command_client import parse_decimal
 
-from .base import Interface, method
+from .base import Interface, category, method
 
 
 class CurrentSensorInterface(Interface):
@@ -45,11 +45,8 @@ class CurrentSensorInterface(Interface):
             value,
         )
 
-    @override
-    def handle_category_status(self, category: str, *args: str) -> list[str]:
-        if category == "CURRENT":
-            # STATUS CURRENT
-            # -> S:CURRENT <id> <current>
-            return self.update_properties({"current": Decimal(args[0])})
-
-        return super().handle_category_status(category, *args)
+    @category("CURRENT")
+    def _handle_current_status(self, *args: str) -> list[str]:
+        # STATUS CURRENT
+        # -> S:CURRENT <id> <current>
+        return self.update_properties({"current": parse_decimal(args[0])})
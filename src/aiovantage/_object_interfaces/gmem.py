@@ -1,11 +1,13 @@
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from typing_extensions import override
 
 from aiovantage.command_client import Converter
 
-from .base import Interface, method
+from .base import Interface, category, method
 
 
 class GMemInterface(Interface):
@@ -89,26 +91,43 @@ class GMemInterface(Interface):
     async def fetch_state(self, *_properties: str) -> list[str]:
         return self.update_properties({"value": await self.get_value()})
 
-    @override
-    def handle_category_status(self, category: str, *args: str) -> list[str]:
-        if category == "VARIABLE":
-            # STATUS VARIABLE
-            # -> S:VARIABLE <id> <value>
-            return self.update_properties({"value": _parse_gmem_value(args[0])})
+    @category("VARIABLE")
+    def _handle_variable_status(self, *args: str) -> list[str]:
+        # STATUS VARIABLE
+        # -> S:VARIABLE <id> <value>
+        return self.update_properties({"value": _parse_gmem_value(args[0])})
 
-        return super().handle_category_status(category, *args)
 
+# Variables tend to toggle between a small set of values, and the parsed values are
+# immutable, so int and str values are cached. Byte arrays can be large, so they aren't.
+@lru_cache(maxsize=512)
+def _parse_gmem_int(value: str) -> int:
+    return Converter.deserialize(int, value)
 
-def _parse_gmem_value(value: str) -> int | str | bool:
-    # If a "" wrapped string, return as str
-    if value.startswith('"') and value.endswith('"'):
-        return Converter.deserialize(str, value)
 
-    # If a {} or [] wrapped string, return as bytes
-    if (value.startswith("{") and value.endswith("}")) or (
-        value.startswith("[") and value.endswith("]")
-    ):
-        return Converter.deserialize(bytes, value)
+@lru_cache(maxsize=512)
+def _parse_gmem_str(value: str) -> str:
+    return Converter.deserialize(str, value)
 
-    # Otherwise, return as int
-    return Converter.deserialize(int, value)
+
+def _parse_gmem_bytes(value: str) -> bytes:
+    return Converter.deserialize(bytes, value)
+
+
+# Opening characters of wrapped GMem values, mapped to their closing character and the
+# parser for the type they represent
+_GMEM_PARSERS: dict[str, tuple[str, Callable[[str], int | str | bytes]]] = {
+    '"': ('"', _parse_gmem_str),
+    "{": ("}", _parse_gmem_bytes),
+    "[": ("]", _parse_gmem_bytes),
+}
+
+
+def _parse_gmem_value(value: str) -> int | str | bytes:
+    # If a "", {} or [] wrapped string, parse as str or bytes
+    wrapper = _GMEM_PARSERS.get(value[:1])
+    if wrapper is not None and value.endswith(wrapper[0]):
+        return wrapper[1](value)
+
+    # Otherwise, parse as int
+    return _parse_gmem_int(value)
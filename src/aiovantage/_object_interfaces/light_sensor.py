@@ -1,8 +1,6 @@
 from decimal import Decimal
 
-from typing_extensions import override
-
-from .base import Interface, method
+from .base import Interface, category, method
 
 
 class LightSensorInterface(Interface):
@@ -41,11 +39,8 @@ class LightSensorInterface(Interface):
         # -> R:INVOKE <id> <rcode> LightSensor.SetLevel <level>
         await self.invoke("LightSensor.SetLevel", level)
 
-    @override
-    def handle_category_status(self, category: str, *args: str) -> list[str]:
-        if category == "LIGHT":
-            # STATUS LIGHT
-            # -> S:LIGHT <id> <level>
-            return self.update_properties({"level": Decimal(args[0])})
-
-        return super().handle_category_status(category, *args)
+    @category("LIGHT")
+    def _handle_light_status(self, *args: str) -> list[str]:
+        # STATUS LIGHT
+        # -> S:LIGHT <id> <level>
+        return self.update_properties({"level": Decimal(args[0])})
@@ -1,9 +1,7 @@
 from decimal import Decimal
 from enum import IntEnum
 
-from typing_extensions import override
-
-from .base import Interface, method
+from .base import Interface, category, method
 
 
 class LoadInterface(Interface):
@@ -217,11 +215,8 @@ class LoadInterface(Interface):
         """Return True if the load is on."""
         return bool(self.level)
 
-    @override
-    def handle_category_status(self, category: str, *args: str) -> list[str]:
-        if category == "LOAD":
-            # STATUS LOAD
-            # -> S:LOAD <id> <level (0-100)>
-            return self.update_properties({"level": Decimal(args[0])})
-
-        return super().handle_category_status(category, *args)
+    @category("LOAD")
+    def _handle_load_status(self, *args: str) -> list[str]:
+        # STATUS LOAD
+        # -> S:LOAD <id> <level (0-100)>
+        return self.update_properties({"level": Decimal(args[0])})
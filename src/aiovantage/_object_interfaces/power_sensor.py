@@ -1,8 +1,6 @@
 from decimal import Decimal
 
-from typing_extensions import override
-
-from .base import Interface, method
+from .base import Interface, category, method
 
 
 class PowerSensorInterface(Interface):
@@ -44,11 +42,8 @@ class PowerSensorInterface(Interface):
             "PowerSensor.SetPowerSW" if sw else "PowerSensor.SetPower", value
         )
 
-    @override
-    def handle_category_status(self, category: str, *args: str) -> list[str]:
-        if category == "POWER":
-            # STATUS POWER
-            # -> S:POWER <id> <power>
-            return self.update_properties({"power": Decimal(args[0])})
-
-        return super().handle_category_status(category, *args)
+    @category("POWER")
+    def _handle_power_status(self, *args: str) -> list[str]:
+        # STATUS POWER
+        # -> S:POWER <id> <power>
+        return self.update_properties({"power": Decimal(args[0])})
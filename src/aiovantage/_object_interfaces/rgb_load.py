@@ -1,10 +1,11 @@
+import asyncio
 from decimal import Decimal
 from enum import IntEnum
-from itertools import islice
+from typing import Any
 
 from typing_extensions import override
 
-from aiovantage.command_client import Converter
+from aiovantage._logger import logger
 
 from .base import Interface, method
 
@@ -46,10 +47,23 @@ class RGBLoadInterface(Interface):
     rgbw: tuple[int, int, int, int] | None = None
     hsl: tuple[int, int, int] | None = None
 
+    def __post_init__(self) -> None:
+        # Coalesced color changes waiting to be sent, keyed by whether they set the
+        # cached or hardware value, since those are set by separate requests
+        self._pending_colors: dict[
+            bool, tuple[str, tuple[Any, ...], asyncio.Task[None]]
+        ] = {}
+
     # Methods
     @method("SetRGB", "SetRGBSW")
     async def set_rgb(
-        self, red: int = 255, green: int = 255, blue: int = 255, *, sw: bool = False
+        self,
+        red: int = 255,
+        green: int = 255,
+        blue: int = 255,
+        *,
+        sw: bool = False,
+        coalesce: bool = False,
     ) -> None:
         """Set the color of an RGB load.
 
@@ -58,11 +72,19 @@ class RGBLoadInterface(Interface):
             green: The green value of the color, (0-255)
             blue: The blue value of the color, (0-255)
             sw: Set the cached value instead of the hardware value.
+            coalesce: Collapse color changes made in the same event loop iteration
+                into a single request, sending only the last one. Useful for rapid
+                changes, eg. from a color picker.
         """
         # INVOKE <id> RGBLoad.SetRGB <red> <green> <blue>
         # -> R:INVOKE <id> <rcode> RGBLoad.SetRGB <red> <green> <blue>
-        await self.invoke(
-            "RGBLoad.SetRGBSW" if sw else "RGBLoad.SetRGB", red, green, blue
+        await self._set_color(
+            "RGBLoad.SetRGBSW" if sw else "RGBLoad.SetRGB",
+            red,
+            green,
+            blue,
+            sw=sw,
+            coalesce=coalesce,
         )
 
     @method("GetRGB", "GetRGBHW")
@@ -90,6 +112,7 @@ class RGBLoadInterface(Interface):
         lightness: float | Decimal,
         *,
         sw: bool = False,
+        coalesce: bool = False,
     ) -> None:
         """Set the color of an HSL load.
 
@@ -98,11 +121,22 @@ class RGBLoadInterface(Interface):
             saturation: The saturation value of the color, in percent (0-100).
             lightness: The lightness value of the color, in percent (0-100).
             sw: Set the cached value instead of the hardware value.
+            coalesce: Collapse color changes made in the same event loop iteration
+                into a single request, sending only the last one. Useful for rapid
+                changes, eg. from a color picker.
         """
         # INVOKE <id> RGBLoad.SetHSL <hue> <saturation> <lightness>
         # -> R:INVOKE <id> <rcode> RGBLoad.SetHSL <hue> <saturation> <lightness>
-        await self.invoke(
-            "RGBLoad.SetHSLSW" if sw else "RGBLoad.SetHSL", hue, saturation, lightness
+
+        # Coerce to float, which formats faster than Decimal and serializes in the
+        # same fixed-point form
+        await self._set_color(
+            "RGBLoad.SetHSLSW" if sw else "RGBLoad.SetHSL",
+            hue,
+            float(saturation),
+            float(lightness),
+            sw=sw,
+            coalesce=coalesce,
         )
 
     @method("GetHSL", "GetHSLHW")
@@ -157,7 +191,9 @@ class RGBLoadInterface(Interface):
         """
         # INVOKE <id> RGBLoad.DissolveHSL <hue> <saturation> <lightness> <rate>
         # -> R:INVOKE <id> <rcode> RGBLoad.DissolveHSL <hue> <saturation> <lightness> <rate>
-        await self.invoke("RGBLoad.DissolveHSL", hue, saturation, lightness, rate)
+        await self.invoke(
+            "RGBLoad.DissolveHSL", hue, float(saturation), float(lightness), rate
+        )
 
     @method("SetDissolveRate", "SetDissolveRateSW")
     async def set_dissolve_rate(
@@ -396,6 +432,7 @@ class RGBLoadInterface(Interface):
         white: int = 255,
         *,
         sw: bool = False,
+        coalesce: bool = False,
     ) -> None:
         """Set the color of an RGBW load.
 
@@ -405,11 +442,20 @@ class RGBLoadInterface(Interface):
             blue: The blue value of the color, (0-255)
             white: The white value of the color, (0-255)
             sw: Set the cached value instead of the hardware value.
+            coalesce: Collapse color changes made in the same event loop iteration
+                into a single request, sending only the last one. Useful for rapid
+                changes, eg. from a color picker.
         """
         # INVOKE <id> RGBLoad.SetRGBW <red> <green> <blue> <white>
         # -> R:INVOKE <id> <rcode> RGBLoad.SetRGBW <red> <green> <blue> <white>
-        await self.invoke(
-            "RGBLoad.SetRGBWSW" if sw else "RGBLoad.SetRGBW", red, green, blue, white
+        await self._set_color(
+            "RGBLoad.SetRGBWSW" if sw else "RGBLoad.SetRGBW",
+            red,
+            green,
+            blue,
+            white,
+            sw=sw,
+            coalesce=coalesce,
         )
 
     @method("GetRGBW", "GetRGBWHW")
@@ -447,7 +493,10 @@ class RGBLoadInterface(Interface):
         Returns:
             The value of the RGB color as a tuple of (red, green, blue).
         """
-        return tuple([await self.get_rgb(chan) for chan in islice(self.RGBChannel, 3)])
+        # GetColor returns all channels packed into a single integer, so this takes
+        # one request rather than one per channel
+        color = (await self.get_color()).to_bytes(4, byteorder="big", signed=True)
+        return (color[0], color[1], color[2])
 
     async def get_rgbw_color(self) -> tuple[int, ...]:
         """Get the RGBW color of a load from the controller.
@@ -455,7 +504,11 @@ class RGBLoadInterface(Interface):
         Returns:
             The value of the RGBW color as a tuple of (red, green, blue, white).
         """
-        return tuple([await self.get_rgbw(chan) for chan in self.RGBChannel])
+        # GetColor always seems to report a W value of 0, so fetch each channel.
+        # Channels are requested concurrently, gather returns them in channel order.
+        return tuple(
+            await asyncio.gather(*[self.get_rgbw(chan) for chan in _RGBW_CHANNELS])
+        )
 
     async def get_hsl_color(self) -> tuple[int, ...]:
         """Get the HSL color of a load from the controller.
@@ -463,7 +516,38 @@ class RGBLoadInterface(Interface):
         Returns:
             The value of the HSL color as a tuple of (hue, saturation, lightness).
         """
-        return tuple([await self.get_hsl(attr) for attr in self.HSLAttribute])
+        # Attributes are requested concurrently, gather returns them in order
+        return tuple(
+            await asyncio.gather(*[self.get_hsl(attr) for attr in _HSL_ATTRIBUTES])
+        )
+
+    # Color changes made in quick succession, eg. while dragging a color picker,
+    # replace each other. When coalescing, the first change in an event loop
+    # iteration schedules a request, later changes in the same iteration replace
+    # its parameters, and every caller waits for that single request to complete.
+    async def _set_color(
+        self, method: str, *params: Any, sw: bool, coalesce: bool
+    ) -> None:
+        if not coalesce:
+            await self.invoke(method, *params)
+            return
+
+        pending = self._pending_colors.get(sw)
+        if pending is None:
+            task = asyncio.create_task(self._send_pending_color(sw))
+            task.add_done_callback(_log_color_error)
+        else:
+            task = pending[2]
+
+        self._pending_colors[sw] = (method, params, task)
+
+        # Shielded so a cancelled caller doesn't cancel the request for the others
+        await asyncio.shield(task)
+
+    async def _send_pending_color(self, sw: bool) -> None:
+        # Send the latest color change, new changes will schedule a new request
+        method, params, _task = self._pending_colors.pop(sw)
+        await self.invoke(method, *params)
 
     # Status updates for GetRGB, GetRGBW, and GetHSL arrive on multiple lines,
     # one line per channel/attribute. We always want to fetch a complete set of
@@ -474,43 +558,35 @@ class RGBLoadInterface(Interface):
         # Fetch state from other interfaces
         props_changed = await super().fetch_state(*properties)
 
-        # Fetch RGB, HSL, and RGBW colors
+        # Fetch RGB, HSL, and RGBW colors concurrently
+        rgb, hsl, rgbw = await asyncio.gather(
+            self.get_rgb_color(), self.get_hsl_color(), self.get_rgbw_color()
+        )
         props_changed.extend(
-            self.update_properties(
-                {
-                    "rgb": await self.get_rgb_color(),
-                    "hsl": await self.get_hsl_color(),
-                    "rgbw": await self.get_rgbw_color(),
-                }
-            )
+            self.update_properties({"rgb": rgb, "hsl": hsl, "rgbw": rgbw})
         )
 
         return props_changed
 
     @override
     def handle_object_status(self, method: str, result: str, *args: str) -> list[str]:
-        # Define the methods and the number of channels/attributes they return
-        methods = {
-            "RGBLoad.GetRGB": ("rgb", 3),
-            "RGBLoad.GetHSL": ("hsl", 3),
-            "RGBLoad.GetRGBW": ("rgbw", 4),
-        }
-
         # Check if the method is one we're interested in
-        if method not in methods:
+        color_status = _COLOR_STATUS_METHODS.get(method)
+        if color_status is None:
             return super().handle_object_status(method, result, *args)
 
         # Get the attribute and number of channels/attributes
-        attr, num_channels = methods[method]
+        attr, num_channels = color_status
 
-        # Ignore channels that are out of range
-        channel = Converter.deserialize(int, args[0])
-        if channel not in range(num_channels):
+        # Ignore channels that are out of range. Channels and values are plain
+        # integers, so skip the generic converter lookup.
+        channel = int(args[0])
+        if not 0 <= channel < num_channels:
             return []
 
         # Cache the value
         self._cache = getattr(self, "_cache", [0, 0, 0, 0])
-        self._cache[channel] = Converter.deserialize(int, result)
+        self._cache[channel] = int(result)
 
         # Update the property only if all channels have been received
         if channel == num_channels - 1:
@@ -518,3 +594,24 @@ class RGBLoadInterface(Interface):
             return self.update_properties({attr: new_value})
 
         return []
+
+
+def _log_color_error(task: "asyncio.Task[None]") -> None:
+    # Retrieve the exception of a coalesced color change, so it's not reported as
+    # never retrieved if every caller waiting on it was cancelled
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.debug("Failed to set coalesced color", exc_info=exc)
+
+
+# Color status methods, and the property and number of channels/attributes they update
+_COLOR_STATUS_METHODS = {
+    "RGBLoad.GetRGB": ("rgb", 3),
+    "RGBLoad.GetHSL": ("hsl", 3),
+    "RGBLoad.GetRGBW": ("rgbw", 4),
+}
+
+
+# Color channels and attributes in request order, materialized once rather than
+# iterating the enum classes on every call
+_RGBW_CHANNELS = tuple(RGBLoadInterface.RGBChannel)
+_HSL_ATTRIBUTES = tuple(RGBLoadInterface.HSLAttribute)
@@ -1,8 +1,6 @@
 from enum import IntEnum
 
-from typing_extensions import override
-
-from .base import Interface, method
+from .base import Interface, category, method
 
 
 class TaskInterface(Interface):
@@ -109,11 +107,8 @@ class TaskInterface(Interface):
         # -> R:INVOKE <id> <has context state (0/1)> Task.HasContextState
         return await self.invoke("Task.HasContextState")
 
-    @override
-    def handle_category_status(self, category: str, *args: str) -> list[str]:
-        if category == "TASK":
-            # STATUS TASK
-            # -> S:TASK <id> <state>
-            return self.update_properties({"state": int(args[0])})
-
-        return super().handle_category_status(category, *args)
+    @category("TASK")
+    def _handle_task_status(self, *args: str) -> list[str]:
+        # STATUS TASK
+        # -> S:TASK <id> <state>
+        return self.update_properties({"state": int(args[0])})
@@ -1,8 +1,8 @@
 from decimal import Decimal
 
-from typing_extensions import override
+from aiovantage.command_client import parse_decimal
 
-from .base import Interface, method
+from .base import Interface, category, method
 
 
 class TemperatureInterface(Interface):
@@ -44,11 +44,8 @@ class TemperatureInterface(Interface):
             "Temperature.SetValueSW" if sw else "Temperature.SetValue", value
         )
 
-    @override
-    def handle_category_status(self, category: str, *args: str) -> list[str]:
-        if category == "TEMP":
-            # STATUS TEMP
-            # -> S:TEMP <id> <temp>
-            return self.update_properties({"value": Decimal(args[0])})
-
-        return super().handle_category_status(category, *args)
+    @category("TEMP")
+    def _handle_temp_status(self, *args: str) -> list[str]:
+        # STATUS TEMP
+        # -> S:TEMP <id> <temp>
+        return self.update_properties({"value": parse_decimal(args[0])})
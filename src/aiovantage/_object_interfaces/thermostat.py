@@ -1,54 +1,103 @@
+import asyncio
+from dataclasses import dataclass
 from decimal import Decimal
 from enum import IntEnum
+from typing import Any
 
-from typing_extensions import override
+from aiovantage.errors import NotImplementedError, NotSupportedError
 
-from .base import Interface, method
+from .base import Interface, category, method
 
 
-class ThermostatInterface(Interface):
-    """Thermostat interface."""
+class OperationMode(IntEnum):
+    """Thermostat operation mode."""
 
-    interface_name = "Thermostat"
+    Off = 0
+    Cool = 1
+    Heat = 2
+    Auto = 3
+    Unknown = 4
+
+
+class FanMode(IntEnum):
+    """Thermostat fan mode."""
+
+    Off = 0
+    On = 1
+    Unknown = 2
+
+
+class DayMode(IntEnum):
+    """Thermostat day mode."""
+
+    Day = 0
+    Night = 1
+    Unknown = 2
+    Standby = 3
+
+
+class HoldMode(IntEnum):
+    """The hold mode of the thermostat."""
+
+    Normal = 0
+    Hold = 1
+    Unknown = 2
 
-    class OperationMode(IntEnum):
-        """Thermostat operation mode."""
 
-        Off = 0
-        Cool = 1
-        Heat = 2
-        Auto = 3
-        Unknown = 4
+class Status(IntEnum):
+    """The status of the thermostat."""
 
-    class FanMode(IntEnum):
-        """Thermostat fan mode."""
+    Off = 0
+    Cooling = 1
+    Heating = 2
+    Offline = 3
 
-        Off = 0
-        On = 1
-        Unknown = 2
 
-    class DayMode(IntEnum):
-        """Thermostat day mode."""
+# Category status values, mapped to their enum members
+_THERMOP_MAP = {
+    "OFF": OperationMode.Off,
+    "COOL": OperationMode.Cool,
+    "HEAT": OperationMode.Heat,
+    "AUTO": OperationMode.Auto,
+}
 
-        Day = 0
-        Night = 1
-        Unknown = 2
-        Standby = 3
+_THERMFAN_MAP = {
+    "ON": FanMode.On,
+    "AUTO": FanMode.Off,
+}
 
-    class HoldMode(IntEnum):
-        """The hold mode of the thermostat."""
+_THERMDAY_MAP = {
+    "DAY": DayMode.Day,
+    "NIGHT": DayMode.Night,
+}
 
-        Normal = 0
-        Hold = 1
-        Unknown = 2
 
-    class Status(IntEnum):
-        """The status of the thermostat."""
+class ThermostatInterface(Interface):
+    """Thermostat interface."""
+
+    interface_name = "Thermostat"
 
-        Off = 0
-        Cooling = 1
-        Heating = 2
-        Offline = 3
+    # Aliases of the module-level enums, for backwards compatibility
+    OperationMode = OperationMode
+    FanMode = FanMode
+    DayMode = DayMode
+    HoldMode = HoldMode
+    Status = Status
+
+    @dataclass(frozen=True)
+    class Snapshot:
+        """A snapshot of the full state of a thermostat."""
+
+        indoor_temperature: Decimal | None
+        outdoor_temperature: Decimal | None
+        heat_set_point: Decimal | None
+        cool_set_point: Decimal | None
+        auto_set_point: Decimal | None
+        operation_mode: OperationMode | None
+        fan_mode: FanMode | None
+        day_mode: DayMode | None
+        hold_mode: HoldMode | None
+        status: Status | None
 
     # Properties
     indoor_temperature: Decimal | None = None
@@ -369,38 +418,59 @@ class ThermostatInterface(Interface):
             "Thermostat.SetAutoSetPointSW" if sw else "Thermostat.SetAutoSetPoint", temp
         )
 
-    @override
-    def handle_category_status(self, category: str, *args: str) -> list[str]:
-        if category == "THERMOP":
-            # STATUS THERMOP
-            # -> S:THERMOP <id> <operation_mode (OFF/COOL/HEAT/AUTO)>
-            thermop_map = {
-                "OFF": ThermostatInterface.OperationMode.Off,
-                "COOL": ThermostatInterface.OperationMode.Cool,
-                "HEAT": ThermostatInterface.OperationMode.Heat,
-                "AUTO": ThermostatInterface.OperationMode.Auto,
-            }
-
-            return self.update_properties({"operation_mode": thermop_map[args[0]]})
-
-        if category == "THERMFAN":
-            # STATUS THERMFAN
-            # -> S:THERMFAN <id> <fan_mode (ON/AUTO)>
-            thermfan_map = {
-                "ON": ThermostatInterface.FanMode.On,
-                "AUTO": ThermostatInterface.FanMode.Off,
-            }
-
-            return self.update_properties({"fan_mode": thermfan_map[args[0]]})
-
-        if category == "THERMDAY":
-            # STATUS THERMDAY
-            # -> S:THERMDAY <id> <day_mode (DAY/NIGHT)>
-            thermday_map = {
-                "DAY": ThermostatInterface.DayMode.Day,
-                "NIGHT": ThermostatInterface.DayMode.Night,
-            }
-
-            return self.update_properties({"day_mode": thermday_map[args[0]]})
-
-        return super().handle_category_status(category, *args)
+    # Convenience functions, not part of the interface
+    async def get_all(self, *, hw: bool = False) -> Snapshot:
+        """Get the full state of the thermostat.
+
+        The individual requests are issued concurrently, so this should be preferred
+        over calling each getter in turn when fetching the initial state.
+
+        Args:
+            hw: Fetch the values from hardware instead of cache.
+
+        Returns:
+            A snapshot of the thermostat state. Values not supported by the
+            thermostat are None.
+        """
+        results = await asyncio.gather(
+            self.get_indoor_temperature(hw=hw),
+            self.get_outdoor_temperature(hw=hw),
+            self.get_heat_set_point(hw=hw),
+            self.get_cool_set_point(hw=hw),
+            self.get_auto_set_point(hw=hw),
+            self.get_operation_mode(hw=hw),
+            self.get_fan_mode(hw=hw),
+            self.get_day_mode(hw=hw),
+            self.get_hold_mode(hw=hw),
+            self.get_status(hw=hw),
+            return_exceptions=True,
+        )
+
+        values: list[Any] = []
+        for result in results:
+            if isinstance(result, NotImplementedError | NotSupportedError):
+                values.append(None)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                values.append(result)
+
+        return ThermostatInterface.Snapshot(*values)
+
+    @category("THERMOP")
+    def _handle_thermop_status(self, *args: str) -> list[str]:
+        # STATUS THERMOP
+        # -> S:THERMOP <id> <operation_mode (OFF/COOL/HEAT/AUTO)>
+        return self.update_properties({"operation_mode": _THERMOP_MAP[args[0]]})
+
+    @category("THERMFAN")
+    def _handle_thermfan_status(self, *args: str) -> list[str]:
+        # STATUS THERMFAN
+        # -> S:THERMFAN <id> <fan_mode (ON/AUTO)>
+        return self.update_properties({"fan_mode": _THERMFAN_MAP[args[0]]})
+
+    @category("THERMDAY")
+    def _handle_thermday_status(self, *args: str) -> list[str]:
+        # STATUS THERMDAY
+        # -> S:THERMDAY <id> <day_mode (DAY/NIGHT)>
+        return self.update_properties({"day_mode": _THERMDAY_MAP[args[0]]})
@@ -14,3 +14,16 @@ class LoadGroup(LocationObject, LoadInterface):
     load_table: list[int] = field(
         default_factory=list, metadata={"name": "Load", "wrapper": "LoadTable"}
     )
+
+    @property
+    def load_table_set(self) -> frozenset[int]:
+        """Return the load table as a frozenset, for fast membership tests."""
+        # Cache the set, rebuilding it if the load table has been replaced
+        cache: tuple[list[int], frozenset[int]] | None = getattr(
+            self, "_load_table_cache", None
+        )
+        if cache is None or cache[0] is not self.load_table:
+            cache = (self.load_table, frozenset(self.load_table))
+            self._load_table_cache = cache
+
+        return cache[1]
@@ -13,7 +13,7 @@ The service is discoverable via mDNS as `_hc._tcp.local` and/or `_secure_hc._tcp
 """
 
 from ._command_client.client import CommandClient, CommandResponse
-from ._command_client.converter import Converter
+from ._command_client.converter import Converter, parse_decimal
 from ._command_client.events import (
     ConnectEvent,
     DisconnectEvent,
@@ -37,4 +37,5 @@ __all__ = [
     "EventType",
     "ReconnectEvent",
     "StatusEvent",
+    "parse_decimal",
 ]
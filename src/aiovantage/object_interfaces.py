@@ -14,7 +14,9 @@ fixed during normal operation.
 State properties can be retrieved using [`fetch_state`][aiovantage.object_interfaces.Interface.fetch_state]
 and are kept up to date by calling [`handle_object_status`][aiovantage.object_interfaces.Interface.handle_object_status]
 or [`handle_category_status`][aiovantage.object_interfaces.Interface.handle_category_status] when messages are received from the
-command client event stream.
+command client event stream. Interfaces handle "legacy" category status messages, eg.
+"S:LOAD", by registering handlers with the [`category`][aiovantage.object_interfaces.category]
+decorator, rather than by overriding `handle_category_status`.
 
 In practice, controllers are responsible for managing state properties. They handle the
 initial retrieval of state, process updates from the event stream, and ensure that the
@@ -22,7 +24,7 @@ latest state is reflected in the system.
 """
 
 from ._object_interfaces.anemo_sensor import AnemoSensorInterface
-from ._object_interfaces.base import Interface
+from ._object_interfaces.base import Interface, category
 from ._object_interfaces.blind import BlindInterface
 from ._object_interfaces.button import ButtonInterface
 from ._object_interfaces.color_temperature import ColorTemperatureInterface
@@ -63,4 +65,5 @@ __all__ = [
     "TaskInterface",
     "TemperatureInterface",
     "ThermostatInterface",
+    "category",
 ]
@@ -0,0 +1,150 @@
+"""Fake Vantage services, and helpers for building the objects they return."""
+
+import asyncio
+import re
+
+SYSINFO_RESPONSE = (
+    "<IIntrospection><GetSysInfo><return><SysInfo></SysInfo></return>"
+    "</GetSysInfo></IIntrospection>\n"
+)
+
+REQUEST_PATTERN = re.compile(r"<(I\w+)>.*?</\1>", re.DOTALL)
+
+
+def area_xml(vid: int) -> str:
+    """Return the XML for an area object."""
+    return (
+        f'<Area VID="{vid}" Master="1"><Name>Area {vid}</Name>'
+        "<Model></Model><Note></Note><AreaType>Room</AreaType></Area>"
+    )
+
+
+def load_xml(vid: int, load_type: str = "Incandescent") -> str:
+    """Return the XML for a load object."""
+    return (
+        f'<Load VID="{vid}" Master="1"><Name>Load {vid}</Name><Model></Model>'
+        '<Note></Note><Parent Position="0">1</Parent><ContractorNumber>'
+        f"</ContractorNumber><LoadType>{load_type}</LoadType>"
+        "<PowerProfile>0</PowerProfile></Load>"
+    )
+
+
+def load_group_xml(vid: int, load_table: list[int]) -> str:
+    """Return the XML for a load group object."""
+    loads = "".join(f"<Load>{load_vid}</Load>" for load_vid in load_table)
+    return (
+        f'<LoadGroup VID="{vid}" Master="1"><Name>Load Group {vid}</Name>'
+        f"<Model></Model><Note></Note><LoadTable>{loads}</LoadTable></LoadGroup>"
+    )
+
+
+class FakeACIServer:
+    """Fake ACI server, which returns objects from filters in pages.
+
+    The objects the server returns can be changed between requests, eg. to
+    simulate objects being added or removed.
+    """
+
+    def __init__(self, objects: list[str], page_size: int = 2) -> None:
+        """Initialize the server.
+
+        Args:
+            objects: The XML of each object, eg. from `area_xml`.
+            page_size: The number of objects to return per page of filter results.
+        """
+        self.objects = objects
+        self.page_size = page_size
+        self.connections = 0
+        self.requests: list[tuple[int, str]] = []
+        self.server: asyncio.Server | None = None
+        self.handlers: set[asyncio.Task[None]] = set()
+        self.writers: set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> int:
+        """Start the server, returning the port it's listening on."""
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop the server, and wait for client connections to finish."""
+        if self.server is not None:
+            self.server.close()
+
+        for writer in self.writers:
+            writer.close()
+
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        if task := asyncio.current_task():
+            self.handlers.add(task)
+
+        self.writers.add(writer)
+        self.connections += 1
+        conn_id = self.connections
+        pages: dict[int, list[list[str]]] = {}
+        buffer = ""
+        while data := await reader.read(4096):
+            buffer += data.decode()
+            while match := REQUEST_PATTERN.search(buffer):
+                buffer = buffer[match.end() :]
+                request = match.group(0)
+                writer.write(self._respond(conn_id, request, pages).encode())
+                await writer.drain()
+
+        writer.close()
+
+    def _respond(
+        self, conn_id: int, request: str, pages: dict[int, list[list[str]]]
+    ) -> str:
+        if "<GetSysInfo>" in request:
+            return SYSINFO_RESPONSE
+
+        if "<OpenFilter>" in request:
+            types = re.findall(r"<ObjectType>(\w+)</ObjectType>", request)
+            objects = [
+                f'<Object VID="{_vid(obj)}">{obj}</Object>'
+                for obj in self.objects
+                if _type(obj) in types
+            ]
+
+            handle = len(pages) + 1
+            pages[handle] = [
+                objects[i : i + self.page_size]
+                for i in range(0, len(objects), self.page_size)
+            ]
+            self.requests.append((conn_id, "OpenFilter"))
+            return (
+                "<IConfiguration><OpenFilter><return>"
+                f"{handle}</return></OpenFilter></IConfiguration>\n"
+            )
+
+        if "<GetFilterResults>" in request:
+            handle = int(re.findall(r"<hFilter>(\d+)</hFilter>", request)[0])
+            self.requests.append((conn_id, "GetFilterResults"))
+            page = pages[handle].pop(0) if pages[handle] else []
+            return (
+                "<IConfiguration><GetFilterResults><return>"
+                f"{''.join(page)}</return></GetFilterResults></IConfiguration>\n"
+            )
+
+        if "<CloseFilter>" in request:
+            self.requests.append((conn_id, "CloseFilter"))
+            return (
+                "<IConfiguration><CloseFilter><return>true</return>"
+                "</CloseFilter></IConfiguration>\n"
+            )
+
+        raise AssertionError(f"Unexpected request: {request}")
+
+
+def _type(obj: str) -> str:
+    # The type of an object, from its root element
+    return re.findall(r"^<(\w+)", obj)[0]
+
+
+def _vid(obj: str) -> str:
+    # The Vantage ID of an object, from its root element
+    return re.findall(r'VID="(\d+)"', obj)[0]
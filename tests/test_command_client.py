@@ -0,0 +1,233 @@
+"""Tests for the Host Command client, against a fake Host Command server."""
+
+import asyncio
+import gc
+import unittest
+from typing import Any
+
+from aiovantage.command_client import CommandClient
+from aiovantage.errors import (
+    ClientConnectionError,
+    ClientTimeoutError,
+    InvalidParameterError,
+)
+
+
+class FakeHCServer:
+    """Fake Host Command server, which replies to requests in order.
+
+    Replies echo the request, eg. "ECHO 1" -> "R:ECHO 1", with a few special commands:
+    - "ERR": replies with an error
+    - "HELP": replies with data lines, and an interleaved status message
+    - "SLOW <seconds>": replies after a delay
+    - "GARBAGE": replies with undecodable data
+    - "DROP": closes the connection without replying
+    """
+
+    def __init__(self) -> None:
+        """Initialize the server."""
+        self.connections = 0
+        self.server: asyncio.Server | None = None
+        self.handlers: set[asyncio.Task[None]] = set()
+        self.writers: set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> int:
+        """Start the server, returning the port it's listening on."""
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop the server, and wait for client connections to finish."""
+        if self.server is not None:
+            self.server.close()
+
+        for writer in self.writers:
+            writer.close()
+
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.handlers.add(asyncio.current_task())  # type: ignore[arg-type]
+        self.writers.add(writer)
+        self.connections += 1
+        conn_id = self.connections
+        try:
+            while line := (await reader.readline()).decode().strip():
+                command, *args = line.split()
+                if command == "DROP":
+                    break
+
+                if command == "SLOW":
+                    await asyncio.sleep(float(args[0]))
+
+                writer.write(self._reply(conn_id, command, args))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _reply(conn_id: int, command: str, args: list[str]) -> bytes:
+        if command == "ERR":
+            return b"R:ERROR:4 Invalid Parameter\r\n"
+
+        if command == "HELP":
+            return b"line one\r\nS:LOAD 12 50.000\r\nline two\r\nR:HELP\r\n"
+
+        if command == "GARBAGE":
+            return b"R:GARBAGE \xff\xfe\r\n"
+
+        if command == "CONN":
+            args = [str(conn_id)]
+
+        response = f"R:{command} {' '.join(args)}\r\n"
+
+        # Status messages may arrive between responses, but not during the
+        # connection handshake, which reads single lines
+        if args and command != "ELAGG":
+            response = "S:LOAD 1 0\r\n" + response
+
+        return response.encode()
+
+
+class CommandClientTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for CommandClient request pipelining."""
+
+    async def asyncSetUp(self) -> None:
+        """Start a fake Host Command server and connect a client to it."""
+        self.server = FakeHCServer()
+        port = await self.server.start()
+        self.client = CommandClient("127.0.0.1", port=port, ssl=False, read_timeout=0.1)
+
+    async def asyncTearDown(self) -> None:
+        """Close the client and stop the server."""
+        self.client.close()
+        await self.server.close()
+
+    async def test_concurrent_requests_get_their_own_responses(self) -> None:
+        """Concurrent requests are matched with responses in order."""
+        responses = await asyncio.gather(
+            *(self.client.command("ECHO", i) for i in range(20))
+        )
+
+        self.assertEqual([r.args for r in responses], [[str(i)] for i in range(20)])
+
+    async def test_data_lines_and_status_messages(self) -> None:
+        """Data lines are returned, and interleaved status messages are ignored."""
+        response = await self.client.command("HELP")
+
+        self.assertEqual(response.command, "HELP")
+        self.assertEqual(response.data, ["line one", "line two"])
+
+    async def test_error_response(self) -> None:
+        """Error responses raise for that request only."""
+        results = await asyncio.gather(
+            self.client.command("ECHO", 1),
+            self.client.command("ERR"),
+            self.client.command("ECHO", 2),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(results[0].args, ["1"])  # type: ignore[union-attr]
+        self.assertIsInstance(results[1], InvalidParameterError)
+        self.assertEqual(results[2].args, ["2"])  # type: ignore[union-attr]
+
+    async def test_cancelled_request(self) -> None:
+        """Cancelling a request doesn't shift later responses."""
+        cancelled = asyncio.create_task(self.client.command("SLOW", 0.05))
+        later = asyncio.create_task(self.client.command("ECHO", 7))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+
+        self.assertEqual((await later).args, ["7"])
+        self.assertEqual((await self.client.command("ECHO", 8)).args, ["8"])
+
+    async def test_concurrent_requests_are_batched(self) -> None:
+        """Concurrent requests are sent in a single write."""
+        await self.client.command("ECHO", 0)
+
+        # There's no public hook for the connection's writes, so count them there
+        writes: list[str] = []
+        conn = self.client._connection  # pyright: ignore[reportPrivateUsage]
+        write = conn.write
+
+        async def counting_write(request: str) -> None:
+            writes.append(request)
+            await write(request)
+
+        conn.write = counting_write  # type: ignore[method-assign]
+        await asyncio.gather(*(self.client.command("ECHO", i) for i in range(5)))
+
+        self.assertEqual(writes, ["".join(f"ECHO {i}\n" for i in range(5))])
+
+    async def test_cancelled_batch_leader(self) -> None:
+        """Cancelling the request sending a batch still sends the batch.
+
+        Nothing is left to report an exception that's never retrieved, even if
+        the connection is then lost.
+        """
+        errors: list[dict[str, Any]] = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda _, context: errors.append(context)
+        )
+
+        await self.client.command("ECHO", 0)
+        leader = asyncio.create_task(self.client.command("DROP"))
+        follower = asyncio.create_task(self.client.command("ECHO", 1))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        with self.assertRaises(ClientConnectionError):
+            await follower
+
+        del leader
+        gc.collect()
+        self.assertEqual(errors, [])
+
+    async def test_timeout_reconnects(self) -> None:
+        """A timed out request closes the connection, and the next one reconnects."""
+        self.assertEqual((await self.client.command("CONN")).args, ["1"])
+
+        with self.assertRaises(ClientTimeoutError):
+            await self.client.command("SLOW", 0.2)
+
+        # The late response to SLOW must not be delivered to the new connection's
+        # first request
+        await asyncio.sleep(0.2)
+        self.assertEqual((await self.client.command("CONN")).args, ["2"])
+
+    async def test_connection_lost(self) -> None:
+        """Requests fail when the connection drops, and the next one reconnects."""
+        with self.assertRaises(ClientConnectionError):
+            await self.client.command("DROP")
+
+        self.assertEqual((await self.client.command("CONN")).args, ["2"])
+
+    async def test_write_error_reconnects(self) -> None:
+        """A failed write closes the connection, and the next request reconnects."""
+        self.assertEqual((await self.client.command("CONN")).args, ["1"])
+
+        async def failing_write(_request: str) -> None:
+            raise ClientConnectionError("Write failed")
+
+        conn = self.client._connection  # pyright: ignore[reportPrivateUsage]
+        conn.write = failing_write  # type: ignore[method-assign]
+        with self.assertRaises(ClientConnectionError):
+            await self.client.command("ECHO", 1)
+
+        self.assertEqual((await self.client.command("CONN")).args, ["2"])
+
+    async def test_unexpected_reader_error(self) -> None:
+        """Unexpected errors in the reader are logged, and fail waiting requests."""
+        with self.assertLogs("aiovantage", "ERROR"):
+            with self.assertRaises(ClientConnectionError):
+                await self.client.command("GARBAGE")
+
+        self.assertEqual((await self.client.command("CONN")).args, ["2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
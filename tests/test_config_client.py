@@ -0,0 +1,83 @@
+"""Tests for the ACI config client, against a fake ACI server."""
+
+import asyncio
+import unittest
+from collections.abc import AsyncIterator
+
+from fakes import FakeACIServer, area_xml
+
+from aiovantage.config_client import ConfigClient, ConfigurationInterface
+from aiovantage.objects import Area
+
+
+class ConfigClientTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for ConfigClient and ConfigurationInterface.get_objects."""
+
+    async def asyncSetUp(self) -> None:
+        """Start a fake ACI server."""
+        self.server = FakeACIServer([area_xml(vid) for vid in (1, 2, 3)])
+        self.port = await self.server.start()
+        self.client = ConfigClient("127.0.0.1", port=self.port, ssl=False, pool_size=2)
+
+    async def asyncTearDown(self) -> None:
+        """Close the client and stop the server."""
+        self.client.close()
+        await self.server.close()
+
+    async def test_get_objects(self) -> None:
+        """All pages of results are returned, over a single connection."""
+        areas = [
+            area.vid
+            async for area in ConfigurationInterface.get_objects(
+                self.client, "Area", as_type=Area
+            )
+        ]
+
+        self.assertEqual(areas, [1, 2, 3])
+        self.assertEqual(
+            [request for _, request in self.server.requests],
+            ["OpenFilter", "GetFilterResults", "GetFilterResults"]
+            + ["GetFilterResults", "CloseFilter"],
+        )
+        self.assertEqual(len({conn for conn, _ in self.server.requests}), 1)
+
+    async def test_get_objects_doesnt_hold_connection(self) -> None:
+        """Consuming part of the results doesn't block other requests."""
+        self.client.close()
+        self.client = ConfigClient("127.0.0.1", port=self.port, ssl=False)
+
+        objects = ConfigurationInterface.get_objects(self.client, "Area")
+        await anext(objects)
+
+        # The single pooled connection must be available, both to this task and
+        # to other tasks, while the generator is suspended
+        await asyncio.wait_for(
+            ConfigurationInterface.open_filter(self.client, "Area"), 1
+        )
+        await asyncio.wait_for(
+            asyncio.create_task(
+                ConfigurationInterface.open_filter(self.client, "Area")
+            ),
+            1,
+        )
+
+        await objects.aclose()
+
+    async def test_concurrent_get_objects(self) -> None:
+        """Concurrent get_objects calls each keep their filter on one connection."""
+        results = await asyncio.gather(
+            *(
+                self._collect(ConfigurationInterface.get_objects(self.client, "Area"))
+                for _ in range(4)
+            )
+        )
+
+        self.assertEqual(results, [[1, 2, 3]] * 4)
+
+    @staticmethod
+    async def _collect(objects: AsyncIterator[Area]) -> list[int]:
+        return [area.vid async for area in objects]
+
+
+if __name__ == "__main__":
+    unittest.main()
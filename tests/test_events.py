@@ -0,0 +1,58 @@
+"""Tests for delivering controller events to async subscribers."""
+
+import asyncio
+import unittest
+from typing import Any
+
+from fakes import FakeACIServer, load_xml
+
+from aiovantage import Vantage, VantageEvent
+from aiovantage.objects import Load
+
+
+class EventQueueTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for async event subscriptions."""
+
+    async def asyncSetUp(self) -> None:
+        """Start a fake ACI server with a few loads."""
+        self.server = FakeACIServer([load_xml(vid) for vid in (7, 8, 9)])
+        port = await self.server.start()
+        self.vantage = Vantage("127.0.0.1", ssl=False, config_port=port)
+
+    async def asyncTearDown(self) -> None:
+        """Close the client and stop the server."""
+        self.vantage.close()
+        await self.server.close()
+
+    async def test_unsubscribe_from_callback(self) -> None:
+        """A callback that unsubscribes itself still runs to completion."""
+        seen: list[int] = []
+
+        async def once(_event: VantageEvent, obj: Load, _data: dict[str, Any]) -> None:
+            unsubscribe()
+            await asyncio.sleep(0)
+            seen.append(obj.vid)
+
+        unsubscribe = self.vantage.loads.subscribe(once)
+        await self.vantage.loads.initialize(fetch_state=False, monitor_state=False)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(seen, [7])
+
+    async def test_added_events_exceed_queue_size(self) -> None:
+        """Added events are queued beyond the queue size, rather than dropped."""
+        seen: list[int] = []
+
+        async def slow(_event: VantageEvent, obj: Load, _data: dict[str, Any]) -> None:
+            await asyncio.sleep(0)
+            seen.append(obj.vid)
+
+        self.vantage.loads.subscribe(slow, queue_size=1, overflow="drop_newest")
+        await self.vantage.loads.initialize(fetch_state=False, monitor_state=False)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(seen, [7, 8, 9])
+
+
+if __name__ == "__main__":
+    unittest.main()
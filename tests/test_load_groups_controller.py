@@ -0,0 +1,68 @@
+"""Tests for the load groups controller's member loads."""
+
+import unittest
+
+from fakes import FakeACIServer, load_group_xml, load_xml
+
+from aiovantage import Vantage
+
+
+class LoadGroupsControllerTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for LoadGroupsController.loads."""
+
+    async def asyncSetUp(self) -> None:
+        """Start a fake ACI server with a load group of loads 3, 1 and 4."""
+        self.server = FakeACIServer(
+            [load_group_xml(10, [3, 1, 4])] + [load_xml(vid) for vid in range(1, 5)]
+        )
+        port = await self.server.start()
+        self.vantage = Vantage("127.0.0.1", ssl=False, config_port=port)
+        await self.vantage.load_groups.initialize(
+            fetch_state=False, monitor_state=False
+        )
+
+    async def asyncTearDown(self) -> None:
+        """Close the client and stop the server."""
+        self.vantage.close()
+        await self.server.close()
+
+    async def test_loads_queries(self) -> None:
+        """Member loads can be looked up, filtered, and counted."""
+        await self.vantage.loads.initialize(fetch_state=False, monitor_state=False)
+        loads = self.vantage.load_groups.loads(10)
+
+        self.assertIs(loads.get(1), self.vantage.loads[1])
+        self.assertIsNone(loads.get(2))
+        self.assertEqual([load.vid for load in loads.filter(name="Load 4")], [4])
+        self.assertEqual(sum(1 for _ in loads), 3)
+
+    async def test_loads_removed_while_iterating(self) -> None:
+        """Loads can be removed from the loads controller while iterating."""
+        await self.vantage.loads.initialize(fetch_state=False, monitor_state=False)
+
+        seen: list[int] = []
+        async for load in self.vantage.load_groups.loads(10):
+            seen.append(load.vid)
+
+            # Repopulating removes every load the server no longer returns
+            self.server.objects = [load_xml(2)]
+            await self.vantage.loads.initialize(fetch_state=False, monitor_state=False)
+
+        self.assertEqual(seen, [3, 1, 4])
+        self.assertFalse(self.vantage.load_groups.loads(10))
+
+    async def test_load_table_changes(self) -> None:
+        """Querysets reflect changes to the load group's load table."""
+        await self.vantage.loads.initialize(fetch_state=False, monitor_state=False)
+        loads = self.vantage.load_groups.loads(10)
+
+        self.server.objects[0] = load_group_xml(10, [2])
+        await self.vantage.load_groups.initialize(
+            fetch_state=False, monitor_state=False
+        )
+
+        self.assertEqual([load.vid for load in loads], [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
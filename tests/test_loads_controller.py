@@ -0,0 +1,95 @@
+"""Tests for the loads controller's state and type groupings."""
+
+import unittest
+from decimal import Decimal
+
+from fakes import FakeACIServer, load_xml
+
+from aiovantage import Vantage
+
+
+class LoadsControllerTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for LoadsController groupings."""
+
+    async def asyncSetUp(self) -> None:
+        """Start a fake ACI server, and populate a loads controller from it."""
+        self.server = FakeACIServer(
+            [
+                load_xml(3),
+                load_xml(1),
+                load_xml(2, "High Voltage Relay"),
+                load_xml(4, "Motor"),
+            ]
+        )
+        port = await self.server.start()
+        self.vantage = Vantage("127.0.0.1", ssl=False, config_port=port)
+        self.loads = self.vantage.loads
+        await self.loads.initialize(fetch_state=False, monitor_state=False)
+
+    async def asyncTearDown(self) -> None:
+        """Close the client and stop the server."""
+        self.vantage.close()
+        await self.server.close()
+
+    def set_level(self, vid: int, level: int) -> None:
+        """Set the level of a load, as a status message or fetch_state would."""
+        self.loads[vid].update_properties({"level": Decimal(level)})
+
+    async def test_state_groups(self) -> None:
+        """Loads are grouped by state in the controller's order."""
+        self.set_level(2, 100)
+        self.set_level(1, 50)
+
+        self.assertEqual([load.vid for load in self.loads.on], [1, 2])
+        self.assertEqual([load.vid for load in self.loads.off], [3, 4])
+
+    async def test_state_groups_follow_level_changes(self) -> None:
+        """Groups reflect level changes that don't go through the controller."""
+        self.set_level(1, 100)
+        self.set_level(1, 0)
+
+        self.assertFalse(self.loads.on)
+        self.assertIn(self.loads[1], list(self.loads.off))
+
+    async def test_state_change_while_iterating(self) -> None:
+        """Loads can change state while iterating over a group."""
+        for vid in range(1, 5):
+            self.set_level(vid, 100)
+
+        turned_off: list[int] = []
+        async for load in self.loads.on:
+            load.update_properties({"level": Decimal(0)})
+            turned_off.append(load.vid)
+
+        self.assertEqual(turned_off, [3, 1, 2, 4])
+        self.assertFalse(self.loads.on)
+
+    async def test_type_groups(self) -> None:
+        """Loads are grouped by type, and regrouped when their type changes."""
+        self.assertEqual([load.vid for load in self.loads.lights], [3, 1])
+        self.assertEqual([load.vid for load in self.loads.relays], [2])
+        self.assertEqual([load.vid for load in self.loads.motors], [4])
+
+        self.server.objects[3] = load_xml(4)
+        await self.loads.initialize(fetch_state=False, monitor_state=False)
+
+        self.assertEqual([load.vid for load in self.loads.lights], [3, 1, 4])
+        self.assertFalse(self.loads.motors)
+
+    async def test_loads_removed_while_iterating(self) -> None:
+        """Loads can be removed while iterating asynchronously."""
+        seen: list[int] = []
+        async for load in self.loads.lights:
+            seen.append(load.vid)
+
+            # Repopulating removes every load the server no longer returns
+            self.server.objects = [load_xml(2, "High Voltage Relay")]
+            await self.loads.initialize(fetch_state=False, monitor_state=False)
+
+        self.assertEqual(seen, [3, 1])
+        self.assertEqual([load.vid for load in self.loads], [2])
+        self.assertFalse(self.loads.lights)
+
+
+if __name__ == "__main__":
+    unittest.main()